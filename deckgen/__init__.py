@@ -5,6 +5,13 @@ deckgen - Generate beautiful HTML presentations from context
 __version__ = "1.0.0"
 __author__ = "cpark4x"
 
-from .core.orchestrator import DeckOrchestrator
-
 __all__ = ["DeckOrchestrator"]
+
+
+def __getattr__(name):
+    # Import the pipeline lazily so `import deckgen` (and the CLI) stays cheap
+    if name == "DeckOrchestrator":
+        from .core.orchestrator import DeckOrchestrator
+        
+        return DeckOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,8 +7,8 @@ from typing import List, Optional
 
 import click
 
-from .core.orchestrator import DeckOrchestrator
-from .core.designer import ThemeDesigner
+# Pipeline modules are imported inside the commands that need them, so
+# `deckgen --help` and `--version` don't pay for loading them.
 
 
 @click.group()
@@ -58,6 +58,8 @@ def create(
         theme = theme.replace("-", "_")
     
     # Create orchestrator and generate deck
+    from .core.orchestrator import DeckOrchestrator
+    
     orchestrator = DeckOrchestrator()
     
     try:
@@ -83,7 +85,9 @@ def create(
 @cli.command()
 def list_themes():
     """List available themes."""
-    designer = ThemeDesigner()
+    from .core.designer import get_theme_designer
+    
+    designer = get_theme_designer()
     themes = designer.list_themes()
     
     click.echo("\nAvailable Themes:\n")
@@ -104,7 +108,9 @@ def list_themes():
 @click.argument("theme_name")
 def theme_info(theme_name: str):
     """Show details about a theme."""
-    designer = ThemeDesigner()
+    from .core.designer import get_theme_designer
+    
+    designer = get_theme_designer()
     theme_name_normalized = theme_name.replace("-", "_")
     
     theme = designer.get_theme_info(theme_name_normalized)
@@ -1,8 +1,40 @@
 """Core deck generation components."""
 
-from .analyzer import ContentAnalyzer
-from .designer import ThemeDesigner
-from .renderer import HTMLRenderer
-from .orchestrator import DeckOrchestrator
+import importlib
 
-__all__ = ["ContentAnalyzer", "ThemeDesigner", "HTMLRenderer", "DeckOrchestrator"]
+__all__ = [
+    "ContentAnalyzer",
+    "Slide",
+    "ThemeDesigner",
+    "get_theme_designer",
+    "HTMLRenderer",
+    "get_html_renderer",
+    "DeckOrchestrator",
+]
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "ContentAnalyzer": "analyzer",
+    "Slide": "analyzer",
+    "ThemeDesigner": "designer",
+    "get_theme_designer": "designer",
+    "HTMLRenderer": "renderer",
+    "get_html_renderer": "renderer",
+    "DeckOrchestrator": "orchestrator",
+}
+
+
+def __getattr__(name):
+    # Import submodules lazily, so loading one of them (e.g. the designer for
+    # `deckgen list-themes` and `theme-info`) doesn't pull in the renderer,
+    # orchestrator and image generator
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
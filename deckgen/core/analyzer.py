@@ -1,20 +1,133 @@
 """Content analysis and narrative structuring."""
 
+import functools
 import logging
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_HEADER_RE = re.compile(r'^(#{1,4})\s+(.+)$')
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_LINK_RE = re.compile(r'\[(.+?)\]\(.+?\)')
+_DATE_RE = re.compile(
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}'
+)
+# First sentence of a description, minus a leading "create a deck about"
+# style request; group 1 is the title (right-strip it)
+_TITLE_RE = re.compile(
+    r'\s*(?:(?:create|make|build|generate)\s+(?:a\s+)?(?:deck|presentation|slides?)'
+    r'\s+(?:about|for|on)\s+(?=[^\s.]))?([^.]*)',
+    re.I,
+)
+
+
+def _keyword_re(*prefixes: str) -> "re.Pattern[str]":
+    """Compile a pattern matching any of the prefixes at the start of a word."""
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, prefixes)) + ")")
+
+
+def _matches(pattern: "re.Pattern[str]", texts: Tuple[str, ...]) -> bool:
+    """Whether pattern occurs in any of the texts."""
+    return any(pattern.search(text) for text in texts)
+
+
+# Keyword groups used by the content classifiers, each matched in one scan of
+# the lowercased input. Keywords match at the start of a word, so inflected
+# and compound forms ("launching", "codebase") count but words that merely
+# contain one ("api" in "rapid") do not.
+_FEATURE_RE = _keyword_re("feature", "launch", "release", "announce")
+_TECHNICAL_RE = _keyword_re("architecture", "system", "design", "redesign", "technical")
+_BUSINESS_RE = _keyword_re("metrics", "roi", "cost", "revenue", "business")
+_TUTORIAL_RE = _keyword_re("tutorial", "how to", "guide", "learn")
+_VISION_RE = _keyword_re("vision", "strategy", "future", "roadmap")
+
+_TECHNICAL_AUDIENCE_RE = _keyword_re("developer", "engineer", "technical", "code", "api")
+_EXECUTIVE_AUDIENCE_RE = _keyword_re("executive", "ceo", "leadership", "business")
+
+_ENERGETIC_RE = _keyword_re("exciting", "innovative", "revolutionary")
+_PROFESSIONAL_RE = _keyword_re("professional", "enterprise", "formal")
+
+_CODE_RE = _keyword_re("code", "api", "function", "class", "implementation", "syntax")
+
+_MAX_CODE_CHARS = 500  # Longest code excerpt kept for a slide
+_CODE_EXTENSIONS = (".py", ".js", ".ts", ".go", ".rs", ".java", ".cpp")
+
+# Section-title keywords (substring match) that decide which slide type a
+# markdown section becomes.
+_CATEGORY_KEYWORDS: Dict[str, frozenset] = {
+    "skip": frozenset({"configuration", "files created", "environment"}),
+    "architecture": frozenset({"architecture", "diagram", "flow"}),
+    "metrics": frozenset({"result", "metric", "impact", "test"}),
+    "code": frozenset({"code", "implementation", "example"}),
+    "scenario": frozenset({"scenario", "use case", "hero"}),
+    "overview": frozenset({"what", "why", "benefit", "feature", "built"}),
+    "next_steps": frozenset({"next", "step", "action", "start"}),
+}
+
+# All category keywords folded into one pattern, so a title is classified in a
+# single scan. The lookahead makes matches zero-width, so keywords overlapping
+# each other are all found; the named group that matched gives the category.
+_CATEGORY_RE = re.compile("(?=" + "|".join(
+    f"(?P<{category}>{'|'.join(map(re.escape, sorted(keywords)))})"
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+) + ")")
+
+# Terms counted towards technical depth, each at most once
+_TECH_TERM_RE = _keyword_re(
+    "architecture", "implementation", "algorithm", "infrastructure",
+    "api", "database", "microservice", "container", "kubernetes",
+    "protocol", "cache", "queue", "async", "performance",
+)
+
+# Slide types that should receive generated images
+IMAGE_SLIDE_TYPES = frozenset({"title", "section", "hero"})
+
+
+@dataclass(slots=True)
+class Slide:
+    """Slide specification produced by the analyzer and consumed by the designer.
+    
+    Only the fields relevant to ``type`` are populated; the rest keep their
+    empty defaults.
+    """
+    
+    type: str
+    title: str = ""
+    subtitle: str = ""
+    content: str = ""
+    points: List[str] = field(default_factory=list)
+    items: List[str] = field(default_factory=list)
+    cards: List[Dict[str, str]] = field(default_factory=list)
+    table: List[Dict[str, str]] = field(default_factory=list)
+    code: str = ""
+    language: str = ""
+    stats: List[Dict[str, str]] = field(default_factory=list)
+    cta_text: str = ""
+    cta_url: str = ""
+
 
 class ContentAnalyzer:
     """Analyzes content and creates structured content briefs."""
     
+    def __init__(self):
+        """Initialize analyzer with a cache of recent content briefs."""
+        self._analyze_cached = functools.lru_cache(maxsize=64)(self._analyze)
+    
     def analyze(self, description: str, files: List[str] = None) -> Dict[str, Any]:
         """
         Analyze content and determine narrative structure.
         
+        Results are memoized on the description and each file's path (as
+        given and resolved), modification time and size, so re-analyzing unchanged inputs skips
+        reading and parsing. The returned brief is shared between such calls
+        and must not be mutated.
+        
         Args:
             description: User's description of the presentation
             files: Optional list of file paths for additional context
@@ -22,130 +135,218 @@ class ContentAnalyzer:
         Returns:
             Content brief dictionary with structure, type, audience, etc.
         """
+        file_signature = tuple(self._file_signature(f) for f in files or [])
+        return self._analyze_cached(description, file_signature)
+    
+    def _file_signature(self, file_path: str) -> Tuple[str, str, Optional[int], Optional[int]]:
+        """Return (path, resolved path, mtime_ns, size) identifying the current file contents.
+        
+        The resolved path keeps a relative path from matching a different file
+        after the working directory changes.
+        """
+        path = Path(file_path).expanduser()
+        resolved = str(path.resolve())
+        try:
+            stat = path.stat()
+        except OSError:
+            return (file_path, resolved, None, None)
+        return (file_path, resolved, stat.st_mtime_ns, stat.st_size)
+    
+    def _analyze(
+        self,
+        description: str,
+        file_signature: Tuple[Tuple[str, str, Optional[int], Optional[int]], ...],
+    ) -> Dict[str, Any]:
+        """Build the content brief; see analyze()."""
+        files = [path for path, _, _, _ in file_signature]
+        
         # Read and parse file content
-        file_content = self._read_files(files or [])
-        combined_text = f"{description}\n\n{file_content}"
+        file_content = self._read_files(files)
+        
+        # Keep description and file text as separate pieces rather than
+        # concatenating them, so the (possibly large) file text is only
+        # copied once, by lowercasing.
+        texts = (description, file_content)
+        texts_lower = (description.lower(), file_content.lower())
         
-        # Parse markdown structure
-        sections = self._parse_markdown_sections(file_content)
+        # Look for code fences once; parsing and extraction skip fence
+        # tracking entirely when there are none
+        has_fences = "```" in file_content
+        
+        # Parse markdown structure (split into lines once, shared by all sections)
+        sections = self._parse_markdown_sections(file_content.split("\n"), has_fences)
         
         content_brief = {
             "description": description,
-            "content_type": self._determine_content_type(combined_text),
-            "audience": self._determine_audience(combined_text),
-            "tone": self._determine_tone(combined_text),
-            "has_code": self._detect_code_content(combined_text, files),
-            "technical_depth": self._assess_technical_depth(combined_text),
+            "content_type": self._determine_content_type(texts_lower),
+            "audience": self._determine_audience(texts_lower),
+            "tone": self._determine_tone(texts_lower),
+            "has_code": self._detect_code_content(
+                has_fences or "```" in description, texts_lower, files
+            ),
+            "technical_depth": self._assess_technical_depth(texts_lower),
             "sections": sections,
-            "slides": self._generate_slides_from_content(description, sections, combined_text),
+            "slides": self._generate_slides_from_content(
+                description, sections, texts, texts_lower, has_fences
+            ),
         }
         
         return content_brief
     
     def _read_files(self, files: List[str]) -> str:
-        """Read content from all provided files."""
-        content_parts = []
-        
-        for file_path in files:
-            path = Path(file_path).expanduser()
-            if path.exists():
-                try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        content_parts.append(f.read())
-                    logger.debug("Read file: %s", file_path)
-                except Exception as e:
-                    logger.warning("Could not read %s: %s", file_path, e)
-            else:
-                logger.warning("File not found: %s", file_path)
+        """Read content from all provided files.
+        
+        Multiple files are read concurrently; results keep the input order.
+        """
+        if len(files) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+                results = list(executor.map(self._read_file, files))
+        else:
+            results = [self._read_file(f) for f in files]
+        
+        content_parts = [r for r in results if r is not None]
         
         logger.info("Read %d files, total content length: %d chars", 
                    len(content_parts), sum(len(p) for p in content_parts))
         return "\n\n".join(content_parts)
     
-    def _parse_markdown_sections(self, content: str) -> List[Dict[str, Any]]:
-        """Parse markdown content into sections."""
-        if not content.strip():
-            return []
+    def _read_file(self, file_path: str) -> Optional[str]:
+        """Read a single file, returning None if it is missing or unreadable."""
+        path = Path(file_path).expanduser()
+        if not path.exists():
+            logger.warning("File not found: %s", file_path)
+            return None
+        
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+            logger.debug("Read file: %s", file_path)
+            return content
+        except Exception as e:
+            logger.warning("Could not read %s: %s", file_path, e)
+            return None
+    
+    def _parse_markdown_sections(
+        self, lines: List[str], has_fences: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Parse markdown lines into sections.
         
+        H1, H2 and H3 headings start sections (an H1 section carries the
+        document title); H4 headings become subsections. Lines inside fenced
+        code blocks are never treated as headings. Each section carries its
+        body both as the raw ``lines`` list, which slide generation walks, and
+        as joined ``content`` text for consumers of the brief.
+        """
         sections = []
-        current_section = None
-        current_content = []
-        
-        lines = content.split("\n")
+        current_lines: Optional[List[str]] = None
+        in_fence = False
         
         for line in lines:
-            # Check for headers (##, ###, or ####)
-            h2_match = re.match(r'^##\s+(.+)$', line)
-            h3_match = re.match(r'^###\s+(.+)$', line)
-            h4_match = re.match(r'^####\s+(.+)$', line)
+            if has_fences and line.lstrip().startswith("```"):
+                in_fence = not in_fence
             
-            # Treat both H2 and H3 as main sections
-            if h2_match or h3_match:
-                # Save previous section
-                if current_section:
-                    current_section["content"] = "\n".join(current_content).strip()
-                    sections.append(current_section)
-                
-                title = (h2_match or h3_match).group(1).strip()
-                level = 2 if h2_match else 3
-                
-                current_section = {
+            # Check for headers (#, ##, ### or ####); most lines can't be one
+            if line.startswith("#") and not in_fence:
+                header_match = _HEADER_RE.match(line)
+            else:
+                header_match = None
+            level = len(header_match.group(1)) if header_match else 0
+            
+            # H1, H2 and H3 are main sections
+            if 1 <= level <= 3:
+                current_lines = []
+                sections.append({
                     "level": level,
-                    "title": title,
-                    "content": "",
+                    "title": sys.intern(header_match.group(2).strip()),
+                    "lines": current_lines,
                     "subsections": []
-                }
-                current_content = []
+                })
             
-            elif h4_match and current_section:
+            elif current_lines is None:
+                continue  # Text before the first heading isn't part of any section
+            
+            elif level == 4:
                 # H4 becomes subsection
-                current_section["subsections"].append({
-                    "title": h4_match.group(1).strip(),
+                sections[-1]["subsections"].append({
+                    "title": sys.intern(header_match.group(2).strip()),
                     "content": ""
                 })
-                current_content.append(line)
+                current_lines.append(line)
             
             else:
-                current_content.append(line)
+                current_lines.append(line)
         
-        # Don't forget the last section
-        if current_section:
-            current_section["content"] = "\n".join(current_content).strip()
-            sections.append(current_section)
+        for section in sections:
+            section["content"] = "\n".join(section["lines"]).strip()
         
         return sections
     
-    def _extract_bullet_points(self, content: str, max_points: int = 5) -> List[str]:
-        """Extract bullet points from content."""
-        points = []
-        
-        # Match various bullet formats: -, *, •, numbered
-        bullet_pattern = r'^[\s]*[-*•]\s+(.+)$|^[\s]*\d+\.\s+(.+)$'
-        
-        for line in content.split("\n"):
-            match = re.match(bullet_pattern, line)
-            if match:
-                point = match.group(1) or match.group(2)
-                if point:
-                    # Clean up the point
-                    point = re.sub(r'\*\*(.+?)\*\*', r'\1', point)  # Remove bold
-                    point = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', point)  # Clean links
-                    points.append(point.strip())
-                    
-                    if len(points) >= max_points:
-                        break
-        
-        return points
-    
-    def _extract_table_data(self, content: str) -> Optional[List[Dict[str, str]]]:
-        """Extract data from markdown tables."""
-        lines = content.split("\n")
-        table_data = []
-        headers = []
+    def _extract_section_features(
+        self,
+        lines: List[str],
+        max_points: int = 5,
+        max_code_blocks: Optional[int] = None,
+        has_fences: bool = True
+    ) -> Tuple[List[str], Optional[List[Dict[str, str]]], List[Dict[str, str]]]:
+        """Extract bullet points, table data and code blocks in one pass.
+        
+        Walks the section lines once, tracking fenced code blocks and the
+        first markdown table. Lines inside code fences only contribute to the
+        code block, never to bullets or tables. Code lines are only buffered
+        up to the displayed length limit, and at most ``max_code_blocks``
+        blocks are kept. Pass ``has_fences=False`` when the text is known to
+        contain no code fences to skip fence tracking.
+        
+        Returns:
+            Tuple of (bullet points, table rows or None, code blocks)
+        """
+        points: List[str] = []
+        table_data: List[Dict[str, str]] = []
+        headers: List[str] = []
         in_table = False
+        table_done = False
+        code_blocks: List[Dict[str, str]] = []
+        in_code = False
+        code_lang = ""
+        code_lines: List[str] = []
+        code_len = 0
         
         for line in lines:
-            if "|" in line and not line.strip().startswith("|--"):
+            stripped = line.lstrip()
+            
+            # Fenced code blocks
+            if has_fences and stripped.startswith("```"):
+                if not in_code:
+                    in_code = True
+                    code_lang = stripped[3:].strip()
+                    code_lines = []
+                    code_len = 0
+                else:
+                    in_code = False
+                    if max_code_blocks is None or len(code_blocks) < max_code_blocks:
+                        code_blocks.append({
+                            "language": code_lang or "text",
+                            "code": "\n".join(code_lines).strip()[:_MAX_CODE_CHARS]
+                        })
+                continue
+            if in_code:
+                # Leading blank lines are stripped anyway; stop buffering once
+                # the block is longer than what will be kept
+                if code_len < _MAX_CODE_CHARS and (code_lines or stripped):
+                    code_len += len(line) + 1 if code_lines else len(stripped)
+                    code_lines.append(line)
+                continue
+            
+            # Bullet points
+            if len(points) < max_points:
+                point = self._parse_bullet(line)
+                if point is not None:
+                    points.append(point)
+            
+            # First markdown table
+            if table_done:
+                continue
+            if "|" in line and not stripped.startswith("|--"):
                 cells = [c.strip() for c in line.split("|") if c.strip()]
                 
                 if not in_table:
@@ -155,225 +356,254 @@ class ContentAnalyzer:
                     if len(cells) >= len(headers):
                         row = {headers[i]: cells[i] for i in range(len(headers))}
                         table_data.append(row)
-            elif in_table and "|" not in line and line.strip():
-                break  # End of table
+            elif in_table and "|" not in line and stripped:
+                table_done = True  # End of table
         
-        return table_data if table_data else None
+        return points, (table_data if table_data else None), code_blocks
     
-    def _extract_code_blocks(self, content: str) -> List[Dict[str, str]]:
-        """Extract code blocks from markdown."""
-        code_blocks = []
-        pattern = r'```(\w*)\n(.*?)```'
-        
-        matches = re.findall(pattern, content, re.DOTALL)
-        for lang, code in matches:
-            code_blocks.append({
-                "language": lang or "text",
-                "code": code.strip()[:500]  # Limit code length
-            })
-        
-        return code_blocks
+    def _parse_bullet(self, line: str) -> Optional[str]:
+        """Return the cleaned text of a bullet line, or None if it isn't one.
+        
+        Recognizes ``-``, ``*`` and ``•`` markers and ``1.``-style numbering,
+        each followed by whitespace, using plain string checks.
+        """
+        stripped = line.lstrip()
+        if not stripped:
+            return None
+        
+        first = stripped[0]
+        if first in "-*•":
+            marker_end = 1
+        elif first.isdecimal():
+            marker_end = 1
+            while marker_end < len(stripped) and stripped[marker_end].isdecimal():
+                marker_end += 1
+            if stripped[marker_end:marker_end + 1] != ".":
+                return None
+            marker_end += 1
+        else:
+            return None
+        
+        # Marker must be followed by whitespace and some text
+        if not stripped[marker_end:marker_end + 1].isspace():
+            return None
+        point = stripped[marker_end:].strip()
+        if not point:
+            return None
+        
+        # Clean up the point
+        point = _BOLD_RE.sub(r'\1', point)  # Remove bold
+        point = _LINK_RE.sub(r'\1', point)  # Clean links
+        return point.strip()
     
     def _generate_slides_from_content(
         self, 
         description: str, 
         sections: List[Dict[str, Any]],
-        full_text: str
-    ) -> List[Dict[str, Any]]:
+        texts: Tuple[str, ...],
+        texts_lower: Tuple[str, ...],
+        has_fences: bool = True
+    ) -> List[Slide]:
         """Generate slide specifications from parsed content."""
         slides = []
         
         # 1. Title slide
         title = self._extract_title(description, sections)
-        subtitle = self._extract_subtitle(sections, full_text)
-        slides.append({
-            "type": "title",
-            "title": title,
-            "subtitle": subtitle
-        })
-        
-        # 2. Generate slides from sections
-        for section in sections:
+        subtitle = self._extract_subtitle(sections, texts, texts_lower)
+        slides.append(Slide(
+            type="title",
+            title=title,
+            subtitle=subtitle
+        ))
+        
+        # 2. Generate slides from sections; a leading H1 only provides the
+        # deck title, later H1s are ordinary sections
+        body_sections = sections[1:] if sections and sections[0]["level"] == 1 else sections
+        for section in body_sections:
             section_title = section["title"]
-            section_content = section["content"]
+            section_lines = section["lines"]
+            title_lower = section_title.lower()
+            categories = {m.lastgroup for m in _CATEGORY_RE.finditer(title_lower)}
             
             # Skip certain sections
-            skip_titles = ["configuration", "files created", "environment"]
-            if any(skip.lower() in section_title.lower() for skip in skip_titles):
+            if "skip" in categories:
                 continue
             
             # Determine best slide type for this section
-            bullet_points = self._extract_bullet_points(section_content)
-            table_data = self._extract_table_data(section_content)
-            code_blocks = self._extract_code_blocks(section_content)
+            bullet_points, table_data, code_blocks = self._extract_section_features(
+                section_lines, max_code_blocks=1, has_fences=has_fences
+            )
             
             # Architecture/diagram sections
-            if any(word in section_title.lower() for word in ["architecture", "diagram", "flow"]):
-                slides.append({
-                    "type": "architecture",
-                    "title": section_title,
-                    "content": self._get_first_paragraph(section_content),
-                    "points": bullet_points[:4] if bullet_points else []
-                })
+            if "architecture" in categories:
+                slides.append(Slide(
+                    type="architecture",
+                    title=section_title,
+                    content=self._get_first_paragraph(section_lines),
+                    points=bullet_points[:4] if bullet_points else []
+                ))
             
             # Metrics/results sections
-            elif any(word in section_title.lower() for word in ["result", "metric", "impact", "test"]):
+            elif "metrics" in categories:
                 if table_data:
-                    slides.append({
-                        "type": "table",
-                        "title": section_title,
-                        "table": table_data[:5]
-                    })
+                    slides.append(Slide(
+                        type="table",
+                        title=section_title,
+                        table=table_data[:5]
+                    ))
                 elif bullet_points:
-                    slides.append({
-                        "type": "points",
-                        "title": section_title,
-                        "points": bullet_points[:5]
-                    })
+                    slides.append(Slide(
+                        type="points",
+                        title=section_title,
+                        points=bullet_points[:5]
+                    ))
             
             # Code sections
-            elif code_blocks or any(word in section_title.lower() for word in ["code", "implementation", "example"]):
+            elif code_blocks or "code" in categories:
                 if code_blocks:
-                    slides.append({
-                        "type": "code",
-                        "title": section_title,
-                        "code": code_blocks[0]["code"],
-                        "language": code_blocks[0]["language"]
-                    })
+                    slides.append(Slide(
+                        type="code",
+                        title=section_title,
+                        code=code_blocks[0]["code"],
+                        language=code_blocks[0]["language"]
+                    ))
             
             # Scenario/use case sections
-            elif any(word in section_title.lower() for word in ["scenario", "use case", "hero"]):
+            elif "scenario" in categories:
                 if bullet_points:
                     # Split into multiple slides if many points
                     for i in range(0, len(bullet_points), 3):
                         chunk = bullet_points[i:i+3]
-                        slides.append({
-                            "type": "cards",
-                            "title": section_title if i == 0 else f"{section_title} (cont.)",
-                            "cards": [{"title": p.split(":")[0] if ":" in p else p[:30], 
-                                      "description": p.split(":")[-1].strip() if ":" in p else p} 
-                                     for p in chunk]
-                        })
+                        slides.append(Slide(
+                            type="cards",
+                            title=section_title if i == 0 else f"{section_title} (cont.)",
+                            cards=[{"title": p.split(":")[0] if ":" in p else p[:30], 
+                                    "description": p.split(":")[-1].strip() if ":" in p else p} 
+                                   for p in chunk]
+                        ))
             
             # What/Why sections - use points
-            elif any(word in section_title.lower() for word in ["what", "why", "benefit", "feature", "built"]):
+            elif "overview" in categories:
                 if table_data:
-                    slides.append({
-                        "type": "table",
-                        "title": section_title,
-                        "table": table_data[:5]
-                    })
+                    slides.append(Slide(
+                        type="table",
+                        title=section_title,
+                        table=table_data[:5]
+                    ))
                 elif bullet_points:
-                    slides.append({
-                        "type": "points",
-                        "title": section_title,
-                        "points": bullet_points[:5]
-                    })
+                    slides.append(Slide(
+                        type="points",
+                        title=section_title,
+                        points=bullet_points[:5]
+                    ))
                 else:
                     # Use first paragraph as content
-                    para = self._get_first_paragraph(section_content)
+                    para = self._get_first_paragraph(section_lines)
                     if para:
-                        slides.append({
-                            "type": "statement",
-                            "title": section_title,
-                            "content": para
-                        })
+                        slides.append(Slide(
+                            type="statement",
+                            title=section_title,
+                            content=para
+                        ))
             
             # Next steps / CTA sections
-            elif any(word in section_title.lower() for word in ["next", "step", "action", "start"]):
+            elif "next_steps" in categories:
                 if bullet_points:
-                    slides.append({
-                        "type": "numbered",
-                        "title": section_title,
-                        "items": bullet_points[:5]
-                    })
+                    slides.append(Slide(
+                        type="numbered",
+                        title=section_title,
+                        items=bullet_points[:5]
+                    ))
             
             # Default: use points or statement
             elif bullet_points:
-                slides.append({
-                    "type": "points",
-                    "title": section_title,
-                    "points": bullet_points[:5]
-                })
-            elif section_content.strip():
-                para = self._get_first_paragraph(section_content)
+                slides.append(Slide(
+                    type="points",
+                    title=section_title,
+                    points=bullet_points[:5]
+                ))
+            else:
+                para = self._get_first_paragraph(section_lines)
                 if para and len(para) > 20:
-                    slides.append({
-                        "type": "statement",
-                        "title": section_title,
-                        "content": para
-                    })
+                    slides.append(Slide(
+                        type="statement",
+                        title=section_title,
+                        content=para
+                    ))
         
         # 3. Ensure minimum slide count (at least 5 slides)
         min_slides = 5
         if len(slides) < min_slides - 1:  # -1 for closing slide we'll add
-            slides = self._expand_slides(slides, description, min_slides - 1)
+            slides = self._expand_slides(slides, title, min_slides - 1)
         
         # 4. Closing slide
-        slides.append({
-            "type": "cta",
-            "title": "Thank You",
-            "subtitle": "Questions?"
-        })
+        slides.append(Slide(
+            type="cta",
+            title="Thank You",
+            subtitle="Questions?"
+        ))
         
         return slides
     
     def _expand_slides(
         self, 
-        slides: List[Dict[str, Any]], 
-        description: str, 
+        slides: List[Slide], 
+        topic: str, 
         min_count: int
-    ) -> List[Dict[str, Any]]:
-        """Expand slide count by generating topic-based content."""
-        # Extract topic from description
-        topic = self._extract_title(description, [])
+    ) -> List[Slide]:
+        """Expand slide count by generating topic-based content.
         
+        Args:
+            slides: Slides generated so far, starting with the title slide
+            topic: Deck title, used in the generated text
+            min_count: Slide count to reach
+        """
         # Template slides to add based on common presentation structures
         expansion_templates = [
-            {
-                "type": "statement",
-                "title": "The Challenge",
-                "content": f"Understanding the key challenges and opportunities in {topic.lower()}."
-            },
-            {
-                "type": "points",
-                "title": "Key Insights",
-                "points": [
+            Slide(
+                type="statement",
+                title="The Challenge",
+                content=f"Understanding the key challenges and opportunities in {topic.lower()}."
+            ),
+            Slide(
+                type="points",
+                title="Key Insights",
+                points=[
                     "Industry trends and market dynamics",
                     "Critical success factors",
                     "Emerging opportunities",
                     "Strategic considerations"
                 ]
-            },
-            {
-                "type": "points",
-                "title": "Our Approach",
-                "points": [
+            ),
+            Slide(
+                type="points",
+                title="Our Approach",
+                points=[
                     "Research and analysis",
                     "Strategic planning",
                     "Implementation roadmap",
                     "Continuous improvement"
                 ]
-            },
-            {
-                "type": "cards",
-                "title": "Key Benefits",
-                "cards": [
+            ),
+            Slide(
+                type="cards",
+                title="Key Benefits",
+                cards=[
                     {"title": "Efficiency", "description": "Streamlined processes and improved productivity"},
                     {"title": "Innovation", "description": "New capabilities and competitive advantages"},
                     {"title": "Growth", "description": "Expanded opportunities and scalability"}
                 ]
-            },
-            {
-                "type": "numbered",
-                "title": "Next Steps",
-                "items": [
+            ),
+            Slide(
+                type="numbered",
+                title="Next Steps",
+                items=[
                     "Review current state and objectives",
                     "Identify key priorities and resources",
                     "Develop implementation timeline",
                     "Execute and measure results"
                 ]
-            },
+            ),
         ]
         
         # Insert expansion slides after title slide
@@ -391,114 +621,105 @@ class ContentAnalyzer:
         return expanded
     
     def _extract_title(self, description: str, sections: List[Dict[str, Any]]) -> str:
-        """Extract or generate a title."""
+        """Extract or generate a title.
+        
+        A document that opens with an H1 heading uses it as the title directly;
+        otherwise the title is derived from the description.
+        """
         # Check for H1 in first section
         if sections and sections[0].get("level") == 1:
             return sections[0]["title"]
         
-        # Clean up description
-        title = description.split(".")[0].strip()
-        title = re.sub(r'^(create|make|build|generate)\s+(a\s+)?(deck|presentation|slides?)\s+(about|for|on)\s+', '', title, flags=re.I)
+        # Clean up description: one scan of just the first sentence
+        title = _TITLE_RE.match(description).group(1).rstrip()
         
         return title[:80] if len(title) > 80 else title
     
-    def _extract_subtitle(self, sections: List[Dict[str, Any]], full_text: str) -> str:
+    def _extract_subtitle(
+        self, sections: List[Dict[str, Any]], texts: Tuple[str, ...], texts_lower: Tuple[str, ...]
+    ) -> str:
         """Extract or generate a subtitle."""
         # Look for session/date info
-        date_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}', full_text)
-        if date_match:
-            return date_match.group(0)
+        for text in texts:
+            date_match = _DATE_RE.search(text)
+            if date_match:
+                return date_match.group(0)
         
         # Look for "Session Summary" or similar
-        if "session summary" in full_text.lower():
+        if any("session summary" in t for t in texts_lower):
             return "Session Summary"
         
         return ""
     
-    def _get_first_paragraph(self, content: str) -> str:
-        """Get the first meaningful paragraph from content."""
-        paragraphs = content.split("\n\n")
-        
-        for para in paragraphs:
+    def _get_first_paragraph(self, lines: List[str]) -> str:
+        """Get the first meaningful paragraph from content lines."""
+        paragraph: List[str] = []
+        
+        # A trailing empty line flushes the last paragraph
+        for line in chain(lines, ("",)):
+            if line:
+                paragraph.append(line)
+                continue
+            
             # Skip headers, bullets, code blocks
-            para = para.strip()
+            para = "\n".join(paragraph).strip()
+            paragraph = []
             if para and not para.startswith("#") and not para.startswith("-") and not para.startswith("```"):
                 # Clean up markdown
-                para = re.sub(r'\*\*(.+?)\*\*', r'\1', para)
-                para = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', para)
+                para = _BOLD_RE.sub(r'\1', para)
+                para = _LINK_RE.sub(r'\1', para)
                 return para[:300]  # Limit length
         
         return ""
     
-    def _determine_content_type(self, text: str) -> str:
+    def _determine_content_type(self, texts_lower: Tuple[str, ...]) -> str:
         """Determine the type of content."""
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ["feature", "launch", "release", "announce"]):
+        if _matches(_FEATURE_RE, texts_lower):
             return "feature_launch"
-        elif any(word in text_lower for word in ["architecture", "system", "design", "technical"]):
+        elif _matches(_TECHNICAL_RE, texts_lower):
             return "technical"
-        elif any(word in text_lower for word in ["metrics", "roi", "cost", "revenue", "business"]):
+        elif _matches(_BUSINESS_RE, texts_lower):
             return "business"
-        elif any(word in text_lower for word in ["tutorial", "how to", "guide", "learn"]):
+        elif _matches(_TUTORIAL_RE, texts_lower):
             return "tutorial"
-        elif any(word in text_lower for word in ["vision", "strategy", "future", "roadmap"]):
+        elif _matches(_VISION_RE, texts_lower):
             return "vision"
         else:
             return "general"
     
-    def _determine_audience(self, text: str) -> str:
+    def _determine_audience(self, texts_lower: Tuple[str, ...]) -> str:
         """Determine target audience."""
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ["developer", "engineer", "technical", "code", "api"]):
+        if _matches(_TECHNICAL_AUDIENCE_RE, texts_lower):
             return "technical"
-        elif any(word in text_lower for word in ["executive", "ceo", "leadership", "business"]):
+        elif _matches(_EXECUTIVE_AUDIENCE_RE, texts_lower):
             return "executive"
         else:
             return "mixed"
     
-    def _determine_tone(self, text: str) -> str:
+    def _determine_tone(self, texts_lower: Tuple[str, ...]) -> str:
         """Determine presentation tone."""
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ["exciting", "innovative", "revolutionary"]):
+        if _matches(_ENERGETIC_RE, texts_lower):
             return "energetic"
-        elif any(word in text_lower for word in ["professional", "enterprise", "formal"]):
+        elif _matches(_PROFESSIONAL_RE, texts_lower):
             return "professional"
         else:
             return "neutral"
     
-    def _detect_code_content(self, text: str, files: List[str] = None) -> bool:
+    def _detect_code_content(
+        self, has_fences: bool, texts_lower: Tuple[str, ...], files: List[str] = None
+    ) -> bool:
         """Detect if content includes code."""
-        # Check for code blocks
-        if "```" in text:
+        # Cheapest checks first: file extensions, then code fences, then keywords
+        if files and any(f.endswith(_CODE_EXTENSIONS) for f in files):
             return True
         
-        text_lower = text.lower()
-        has_code_keywords = any(word in text_lower for word in [
-            "code", "api", "function", "class", "implementation", "syntax"
-        ])
-        
-        if files:
-            code_extensions = [".py", ".js", ".ts", ".go", ".rs", ".java", ".cpp"]
-            has_code_files = any(
-                any(f.endswith(ext) for ext in code_extensions) 
-                for f in files
-            )
-            return has_code_keywords or has_code_files
+        if has_fences:
+            return True
         
-        return has_code_keywords
+        return _matches(_CODE_RE, texts_lower)
     
-    def _assess_technical_depth(self, text: str) -> float:
+    def _assess_technical_depth(self, texts_lower: Tuple[str, ...]) -> float:
         """Assess technical depth (0.0 to 1.0)."""
-        technical_terms = [
-            "architecture", "implementation", "algorithm", "infrastructure",
-            "api", "database", "microservice", "container", "kubernetes",
-            "protocol", "cache", "queue", "async", "performance"
-        ]
-        
-        text_lower = text.lower()
-        matches = sum(1 for term in technical_terms if term in text_lower)
+        matches = len({term for t in texts_lower for term in _TECH_TERM_RE.findall(t)})
         
         return min(matches / 5.0, 1.0)
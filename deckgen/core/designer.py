@@ -1,35 +1,153 @@
 """Theme and layout selection logic."""
 
+import functools
 import logging
+import os
+import pickle
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 import yaml
 
+from ..utils import get_cache_dir
+from .analyzer import IMAGE_SLIDE_TYPES, Slide
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Bump when the cached theme structure changes
+_THEME_CACHE_VERSION = 1
+_THEME_CACHE_FILE = "themes.pkl"
+
 
 class ThemeDesigner:
     """Selects appropriate theme and layouts based on content analysis."""
     
     def __init__(self):
-        """Initialize designer with available themes."""
+        """Initialize designer with available themes.
+        
+        Prefer get_theme_designer(), which shares one instance per process.
+        """
         self.themes_dir = Path(__file__).parent.parent / "themes"
-        self.themes = self._load_themes()
+        self._load(*self._scan_theme_files())
+    
+    def reload_if_changed(self) -> bool:
+        """Reload themes if any theme file was added, removed or modified.
+        
+        Costs one directory scan and a stat per theme file when nothing
+        changed, so long-running processes can call it before each use.
+        
+        Returns:
+            True if the themes were reloaded
+        """
+        theme_entries, signature = self._scan_theme_files()
+        if signature == self._signature:
+            return False
+        
+        logger.info("Theme files changed, reloading themes")
+        self._load(theme_entries, signature)
+        return True
+    
+    def _load(self, theme_entries: List[os.DirEntry], signature: Tuple) -> None:
+        """Load themes and everything derived from them."""
+        # Read-only view: the instance (and its themes) may be shared
+        self.themes = MappingProxyType(self._load_themes(theme_entries, signature))
+        self._trigger_table = self._build_trigger_table(self.themes)
+        self._signature = signature
+        # (content brief, theme name, slides) of the last design_slides() call
+        self._design_memo: Optional[Tuple[Dict[str, Any], str, List[Dict[str, Any]]]] = None
+    
+    def _scan_theme_files(self) -> Tuple[List[os.DirEntry], Tuple]:
+        """List theme files and build a signature of their name, mtime and size."""
+        with os.scandir(self.themes_dir) as it:
+            theme_entries = sorted(
+                (e for e in it if e.name.endswith(".yaml") and e.is_file()),
+                key=lambda e: e.name,
+            )
+        file_stats = []
+        for entry in theme_entries:
+            stat = entry.stat()
+            file_stats.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        signature = (_THEME_CACHE_VERSION, str(self.themes_dir), tuple(file_stats))
+        return theme_entries, signature
     
-    def _load_themes(self) -> Dict[str, Dict[str, Any]]:
-        """Load all theme configurations."""
-        themes = {}
+    def _load_themes(
+        self, theme_entries: List[os.DirEntry], signature: Tuple
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load all theme configurations.
         
-        for theme_file in self.themes_dir.glob("*.yaml"):
-            with open(theme_file, "r") as f:
-                theme_data = yaml.safe_load(f)
-                theme_name = theme_file.stem
-                themes[theme_name] = theme_data
+        Parsed themes are pickled to the user cache directory together with
+        the signature from _scan_theme_files(); while it matches, the pickle
+        is loaded instead of parsing the YAML again.
+        """
+        themes = self._read_theme_cache(signature)
+        if themes is None:
+            themes = {}
+            for entry in theme_entries:
+                with open(entry.path, "r") as f:
+                    themes[entry.name[:-len(".yaml")]] = yaml.load(f, Loader=_SafeLoader)
+            self._write_theme_cache(signature, themes)
         
-        logger.debug("Loaded %d themes: %s", len(themes), list(themes.keys()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loaded %d themes: %s", len(themes), list(themes.keys()))
         return themes
     
+    def _read_theme_cache(self, signature: Tuple) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Return cached themes if the cache matches signature, else None."""
+        try:
+            cache_path = get_cache_dir() / _THEME_CACHE_FILE
+            with open(cache_path, "rb") as f:
+                cached_signature, themes = pickle.load(f)
+        except Exception as e:
+            logger.debug("Theme cache unavailable: %s", e)
+            return None
+        
+        return themes if cached_signature == signature else None
+    
+    def _write_theme_cache(self, signature: Tuple, themes: Dict[str, Dict[str, Any]]) -> None:
+        """Store parsed themes in the cache; failures only cost the next load."""
+        try:
+            cache_path = get_cache_dir() / _THEME_CACHE_FILE
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((signature, themes), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug("Could not write theme cache: %s", e)
+    
+    def _build_trigger_table(
+        self, themes: Mapping[str, Dict[str, Any]]
+    ) -> Dict[str, Tuple[frozenset, frozenset, float, float, float]]:
+        """Flatten each theme's triggers into a tuple used for scoring.
+        
+        Each entry is (content types, audiences, has_code bonus, depth low,
+        depth high), with the "low-high" technical_depth string parsed once
+        here instead of on every select_theme() call.
+        """
+        table = {}
+        
+        for theme_name, theme_config in themes.items():
+            triggers = theme_config.get("triggers", {})
+            
+            depth_low, depth_high = _parse_depth_range(
+                theme_name, triggers.get("technical_depth", "")
+            )
+            
+            table[theme_name] = (
+                frozenset(triggers.get("content_type", [])),
+                frozenset(triggers.get("audience", [])),
+                1.5 if triggers.get("has_code") else 0.0,
+                depth_low,
+                depth_high,
+            )
+        
+        return table
+    
     def select_theme(
         self, 
         content_brief: Dict[str, Any], 
@@ -54,39 +172,23 @@ class ThemeDesigner:
             logger.warning("Theme '%s' not found, will auto-select", force_theme)
         
         # Score each theme based on its triggers
+        # Read the brief once; the per-theme loop only touches locals and
+        # the precomputed trigger table
         scores: Dict[str, float] = {}
-        content_type = content_brief.get("content_type", "general")
-        audience = content_brief.get("audience", "mixed")
-        has_code = content_brief.get("has_code", False)
-        technical_depth = content_brief.get("technical_depth", 0.0)
+        get = content_brief.get
+        content_type = get("content_type", "general")
+        audience = get("audience", "mixed")
+        has_code = bool(get("has_code", False))
+        technical_depth = get("technical_depth", 0.0)
         
-        for theme_name, theme_config in self.themes.items():
-            score = 0.0
-            triggers = theme_config.get("triggers", {})
-            
-            # Check content_type trigger
-            trigger_content_types = triggers.get("content_type", [])
-            if content_type in trigger_content_types:
-                score += 2.0
-            
-            # Check audience trigger
-            trigger_audiences = triggers.get("audience", [])
-            if audience in trigger_audiences:
-                score += 1.0
-            
-            # Check has_code trigger
-            if triggers.get("has_code") and has_code:
-                score += 1.5
-            
-            # Check technical_depth trigger (e.g., "0.6-1.0")
-            depth_range = triggers.get("technical_depth", "")
-            if isinstance(depth_range, str) and "-" in depth_range:
-                try:
-                    low, high = map(float, depth_range.split("-"))
-                    if low <= technical_depth <= high:
-                        score += 1.5
-                except ValueError:
-                    pass
+        for theme_name, trigger in self._trigger_table.items():
+            content_types, audiences, has_code_bonus, depth_low, depth_high = trigger
+            score = (
+                2.0 * (content_type in content_types)
+                + 1.0 * (audience in audiences)
+                + has_code_bonus * has_code
+                + 1.5 * (depth_low <= technical_depth <= depth_high)
+            )
             
             scores[theme_name] = score
             logger.debug("Theme '%s' score: %.1f", theme_name, score)
@@ -117,147 +219,47 @@ class ThemeDesigner:
             
         Returns:
             List of slide specifications with layout and content
+        
+        Briefs from ContentAnalyzer.analyze() are memoized and shared, so
+        designing the same brief with the same theme again returns the
+        previous slides (in a new list); the slide dicts must not be mutated.
         """
+        memo = self._design_memo
+        if memo is not None and memo[0] is content_brief and memo[1] == theme_name:
+            logger.debug("Reusing slides designed for this brief")
+            return list(memo[2])
+        
         theme = self.themes[theme_name]
+        # Theme data is fixed for the whole deck; read it once, not per slide
+        accent_color = theme.get("colors", {}).get("accent", "#0A84FF")
         slides = []
         
         # Get slides from content brief (now contains real content)
         suggested_slides = content_brief.get("slides", [])
         
         for slide_spec in suggested_slides:
-            slide_type = slide_spec.get("type", "title")
-            designed_slide = self._design_slide(slide_spec, slide_type, theme, theme_name)
+            slide_type = slide_spec.type
+            designed_slide = self._design_slide(slide_spec, slide_type, accent_color, theme_name)
             if designed_slide:
+                # Tag image slides by their content type here, so the image
+                # generator need not re-inspect every slide; the opening
+                # slide always gets one
+                designed_slide["needs_image"] = not slides or slide_type in IMAGE_SLIDE_TYPES
                 slides.append(designed_slide)
         
-        return slides
+        self._design_memo = (content_brief, theme_name, slides)
+        return list(slides)
     
     def _design_slide(
         self, 
-        slide_spec: Dict[str, Any], 
+        slide_spec: Slide, 
         slide_type: str, 
-        theme: Dict[str, Any],
+        accent_color: str,
         theme_name: str
     ) -> Optional[Dict[str, Any]]:
         """Design a single slide based on its type and content."""
-        
-        accent_color = theme.get("colors", {}).get("accent", "#0A84FF")
-        
-        if slide_type == "title":
-            return {
-                "layout": "title_center",
-                "theme": theme_name,
-                "content": {
-                    "title": slide_spec.get("title", "Presentation"),
-                    "subtitle": slide_spec.get("subtitle", ""),
-                    "accent_color": accent_color
-                }
-            }
-        
-        elif slide_type == "statement":
-            return {
-                "layout": "statement",
-                "theme": theme_name,
-                "content": {
-                    "title": slide_spec.get("title", ""),
-                    "statement": slide_spec.get("content", "")
-                }
-            }
-        
-        elif slide_type == "points":
-            points = slide_spec.get("points", [])
-            return {
-                "layout": "bullet_points",
-                "theme": theme_name,
-                "content": {
-                    "title": slide_spec.get("title", "Key Points"),
-                    "points": points
-                }
-            }
-        
-        elif slide_type == "numbered":
-            items = slide_spec.get("items", [])
-            return {
-                "layout": "numbered_list",
-                "theme": theme_name,
-                "content": {
-                    "title": slide_spec.get("title", "Steps"),
-                    "items": items
-                }
-            }
-        
-        elif slide_type == "cards":
-            cards = slide_spec.get("cards", [])
-            return {
-                "layout": "grid_thirds",
-                "theme": theme_name,
-                "content": {
-                    "title": slide_spec.get("title", ""),
-                    "cards": cards
-                }
-            }
-        
-        elif slide_type == "table":
-            table = slide_spec.get("table", [])
-            return {
-                "layout": "table_slide",
-                "theme": theme_name,
-                "content": {
-                    "title": slide_spec.get("title", ""),
-                    "table": table
-                }
-            }
-        
-        elif slide_type == "code":
-            return {
-                "layout": "code_example",
-                "theme": theme_name,
-                "content": {
-                    "title": slide_spec.get("title", "Implementation"),
-                    "code": slide_spec.get("code", "# Code example"),
-                    "language": slide_spec.get("language", "python")
-                }
-            }
-        
-        elif slide_type == "architecture":
-            return {
-                "layout": "architecture",
-                "theme": theme_name,
-                "content": {
-                    "title": slide_spec.get("title", "Architecture"),
-                    "description": slide_spec.get("content", ""),
-                    "points": slide_spec.get("points", [])
-                }
-            }
-        
-        elif slide_type == "metrics":
-            stats = slide_spec.get("stats", [])
-            # Only render metrics slide if we have actual stats
-            if not stats:
-                logger.debug("Skipping metrics slide - no stats provided")
-                return None
-            return {
-                "layout": "stat_grid",
-                "theme": theme_name,
-                "content": {
-                    "title": slide_spec.get("title", "Impact"),
-                    "stats": stats
-                }
-            }
-        
-        elif slide_type == "cta":
-            return {
-                "layout": "cta_final",
-                "theme": theme_name,
-                "content": {
-                    "title": slide_spec.get("title", "Get Started"),
-                    "subtitle": slide_spec.get("subtitle", ""),
-                    "cta_text": slide_spec.get("cta_text", ""),
-                    "cta_url": slide_spec.get("cta_url", "#")
-                }
-            }
-        
-        return None
+        builder = _SLIDE_BUILDERS.get(slide_type)
+        return builder(slide_spec, accent_color, theme_name) if builder else None
     
     def get_theme_info(self, theme_name: str) -> Dict[str, Any]:
         """Get theme configuration."""
@@ -277,3 +279,182 @@ class ThemeDesigner:
             })
         
         return theme_list
+
+
+# Slide builders, see _SLIDE_BUILDERS. The analyzer always fills in a slide's
+# title (and a code slide's code and language), so those pass through as-is,
+# even when empty; cta_url is never filled in and falls back to "#".
+def _build_title(spec: Slide, accent_color: str, theme_name: str) -> Dict[str, Any]:
+    """Title slide, with the theme accent."""
+    return {
+        "layout": "title_center",
+        "theme": theme_name,
+        "content": {
+            "title": spec.title,
+            "subtitle": spec.subtitle,
+            "accent_color": accent_color
+        }
+    }
+
+
+def _build_statement(spec: Slide, accent_color: str, theme_name: str) -> Dict[str, Any]:
+    """Single-statement slide."""
+    return {
+        "layout": "statement",
+        "theme": theme_name,
+        "content": {
+            "title": spec.title,
+            "statement": spec.content
+        }
+    }
+
+
+def _build_points(spec: Slide, accent_color: str, theme_name: str) -> Dict[str, Any]:
+    """Bullet-point slide."""
+    return {
+        "layout": "bullet_points",
+        "theme": theme_name,
+        "content": {
+            "title": spec.title,
+            "points": spec.points
+        }
+    }
+
+
+def _build_numbered(spec: Slide, accent_color: str, theme_name: str) -> Dict[str, Any]:
+    """Numbered-list slide."""
+    return {
+        "layout": "numbered_list",
+        "theme": theme_name,
+        "content": {
+            "title": spec.title,
+            "items": spec.items
+        }
+    }
+
+
+def _build_cards(spec: Slide, accent_color: str, theme_name: str) -> Dict[str, Any]:
+    """Card grid slide."""
+    return {
+        "layout": "grid_thirds",
+        "theme": theme_name,
+        "content": {
+            "title": spec.title,
+            "cards": spec.cards
+        }
+    }
+
+
+def _build_table(spec: Slide, accent_color: str, theme_name: str) -> Dict[str, Any]:
+    """Data table slide."""
+    return {
+        "layout": "table_slide",
+        "theme": theme_name,
+        "content": {
+            "title": spec.title,
+            "table": spec.table
+        }
+    }
+
+
+def _build_code(spec: Slide, accent_color: str, theme_name: str) -> Dict[str, Any]:
+    """Code example slide."""
+    return {
+        "layout": "code_example",
+        "theme": theme_name,
+        "content": {
+            "title": spec.title,
+            "code": spec.code,
+            "language": spec.language
+        }
+    }
+
+
+def _build_architecture(spec: Slide, accent_color: str, theme_name: str) -> Dict[str, Any]:
+    """Architecture overview slide."""
+    return {
+        "layout": "architecture",
+        "theme": theme_name,
+        "content": {
+            "title": spec.title,
+            "description": spec.content,
+            "points": spec.points
+        }
+    }
+
+
+def _build_metrics(spec: Slide, accent_color: str, theme_name: str) -> Optional[Dict[str, Any]]:
+    """Stat grid slide, or None when the spec has no stats."""
+    # Only render metrics slide if we have actual stats
+    if not spec.stats:
+        logger.debug("Skipping metrics slide - no stats provided")
+        return None
+    return {
+        "layout": "stat_grid",
+        "theme": theme_name,
+        "content": {
+            "title": spec.title,
+            "stats": spec.stats
+        }
+    }
+
+
+def _build_cta(spec: Slide, accent_color: str, theme_name: str) -> Dict[str, Any]:
+    """Closing call-to-action slide."""
+    return {
+        "layout": "cta_final",
+        "theme": theme_name,
+        "content": {
+            "title": spec.title,
+            "subtitle": spec.subtitle,
+            "cta_text": spec.cta_text,
+            "cta_url": spec.cta_url or "#"
+        }
+    }
+
+
+# Slide type -> builder; unknown types are dropped by _design_slide
+_SLIDE_BUILDERS: Dict[str, Callable[[Slide, str, str], Optional[Dict[str, Any]]]] = {
+    "title": _build_title,
+    "statement": _build_statement,
+    "points": _build_points,
+    "numbered": _build_numbered,
+    "cards": _build_cards,
+    "table": _build_table,
+    "code": _build_code,
+    "architecture": _build_architecture,
+    "metrics": _build_metrics,
+    "cta": _build_cta,
+}
+
+
+def _parse_depth_range(theme_name: str, depth_range: Any) -> Tuple[float, float]:
+    """Parse a "low-high" technical_depth trigger into floats.
+    
+    Missing or malformed ranges become an empty range (low > high) that
+    never matches; malformed ones are logged since they are theme bugs.
+    """
+    if isinstance(depth_range, str) and "-" in depth_range:
+        try:
+            depth_low, depth_high = map(float, depth_range.split("-"))
+            return depth_low, depth_high
+        except ValueError:
+            logger.warning(
+                "Theme '%s' has invalid technical_depth range %r", theme_name, depth_range
+            )
+    return float("inf"), float("-inf")
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_theme_designer() -> ThemeDesigner:
+    return ThemeDesigner()
+
+
+def get_theme_designer() -> ThemeDesigner:
+    """Return the process-wide ThemeDesigner, loading themes on first use.
+    
+    Later calls reload the themes if their files changed on disk.
+    """
+    designer = _shared_theme_designer()
+    designer.reload_if_changed()
+    return designer
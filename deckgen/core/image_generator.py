@@ -1,17 +1,33 @@
 """AI-powered image generation for presentation slides."""
 
 import base64
+import hashlib
 import json
 import logging
 import os
-import urllib.request
+import random
+import tempfile
+import time
 import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
-logger = logging.getLogger(__name__)
+from ..utils import get_cache_dir
+from .analyzer import IMAGE_SLIDE_TYPES
 
-# Slide types that should receive generated images
-IMAGE_SLIDE_TYPES = {"title", "section", "hero"}
+try:
+    import orjson
+    
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup, see the "fast" extra
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
 
 # Style modifiers based on theme
 THEME_STYLES = {
@@ -34,10 +50,78 @@ DEFAULT_STYLE = {
 }
 
 
+def _prompt_template(theme_style: Dict[str, str]) -> str:
+    """Bake a theme's style into a prompt with {subject} and {extra} slots."""
+    return (
+        f"Create a {theme_style['style']} background image for a presentation slide. "
+        f"Theme: {theme_style['mood']}. "
+        "Topic: {subject}. "
+        f"Color palette: {theme_style['colors']}. "
+        "The image should be subtle enough to allow white text overlay. "
+        "No text or words in the image. "
+        "Aspect ratio: 16:9, landscape orientation.{extra}"
+    )
+
+
+# Theme prompts are fixed, so only the subject varies per slide
+_PROMPT_TEMPLATES = {name: _prompt_template(style) for name, style in THEME_STYLES.items()}
+_DEFAULT_PROMPT_TEMPLATE = _prompt_template(DEFAULT_STYLE)
+
+# Slide-type specific guidance appended to the prompt
+_SLIDE_TYPE_GUIDANCE = {
+    "title": " This is a title slide - make it visually striking but not overwhelming.",
+    "section": " This is a section divider - use abstract shapes or subtle patterns.",
+}
+
+# Concurrent image requests; keep within the provider's per-key rate limit
+DEFAULT_MAX_WORKERS = 4
+
+# Retries for rate-limited (HTTP 429) requests, with jittered exponential backoff
+MAX_RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 2.0
+# Longest server-requested Retry-After wait honoured, in seconds
+MAX_RETRY_AFTER = RATE_LIMIT_BACKOFF * 2 ** MAX_RATE_LIMIT_RETRIES
+
+
+def _env_max_workers() -> int:
+    """Read DECKGEN_IMAGE_WORKERS, falling back to the default if it is unusable."""
+    value = os.environ.get("DECKGEN_IMAGE_WORKERS")
+    if value is None:
+        return DEFAULT_MAX_WORKERS
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            "Ignoring invalid DECKGEN_IMAGE_WORKERS=%r, using %d",
+            value, DEFAULT_MAX_WORKERS,
+        )
+        return DEFAULT_MAX_WORKERS
+
+
+def _slide_needs_image(slide: Dict[str, Any], index: int) -> bool:
+    """Decide whether a slide should receive a generated background image.
+    
+    Slides from ThemeDesigner carry a precomputed "needs_image" tag; other
+    slides fall back to their layout, and the first slide always qualifies.
+    A truthy "generate_image" requests an image explicitly.
+    """
+    needs_image = slide.get("needs_image")
+    if needs_image is None:
+        # Cheapest test first: the opening slide needs no dict lookup
+        needs_image = index == 0 or slide.get("layout", "") in IMAGE_SLIDE_TYPES
+    return needs_image or bool(slide.get("generate_image", False))
+
+
 class ImageGenerator:
     """Generates images for presentation slides using Gemini's native image generation."""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "nano-banana-pro-preview"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "nano-banana-pro-preview",
+        max_workers: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+    ):
         """Initialize the image generator.
         
         Args:
@@ -46,6 +130,11 @@ class ImageGenerator:
                    - "nano-banana-pro-preview" (Gemini 3 Pro, default)
                    - "gemini-2.0-flash-exp-image-generation"
                    - "imagen-4.0-generate-001" (uses different API)
+            max_workers: Maximum concurrent image requests. If not provided,
+                   reads DECKGEN_IMAGE_WORKERS, defaulting to DEFAULT_MAX_WORKERS.
+            use_cache: Whether to reuse and store generated images on disk
+                   (see _generate_image()). If not provided, the cache is used
+                   unless DECKGEN_NO_IMAGE_CACHE is set to a non-empty value.
         """
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
         if not self.api_key:
@@ -54,6 +143,10 @@ class ImageGenerator:
         self.model = model
         self.base_url = "https://generativelanguage.googleapis.com/v1beta"
         self._use_imagen_api = model.startswith("imagen-")
+        self.max_workers = max(1, max_workers or _env_max_workers())
+        if use_cache is None:
+            use_cache = not os.environ.get("DECKGEN_NO_IMAGE_CACHE")
+        self.use_cache = use_cache
         
     @property
     def enabled(self) -> bool:
@@ -65,6 +158,7 @@ class ImageGenerator:
         slides: List[Dict[str, Any]],
         theme_name: str,
         deck_context: str = "",
+        indices: Optional[List[int]] = None,
     ) -> List[Dict[str, Any]]:
         """Generate images for slides that need them.
         
@@ -72,33 +166,35 @@ class ImageGenerator:
             slides: List of slide specifications
             theme_name: Name of the theme being used
             deck_context: Overall context/topic of the presentation
+            indices: Positions of the slides to illustrate. If not provided,
+                     they are derived from each slide's "needs_image" tag
+                     (set by ThemeDesigner), see _slide_needs_image().
             
         Returns:
-            Updated slides with image data added
+            Updated slides, with raw image bytes under "background_image"
         """
         if not self.enabled:
             logger.info("Image generation disabled - no API key")
             return slides
         
-        theme_style = THEME_STYLES.get(theme_name, DEFAULT_STYLE)
+        if indices is None:
+            indices = [i for i, slide in enumerate(slides) if _slide_needs_image(slide, i)]
+        
+        prompt_template = _PROMPT_TEMPLATES.get(theme_name, _DEFAULT_PROMPT_TEMPLATE)
+        
+        # Build prompts up front so the requests can run concurrently
+        prompts: Dict[int, str] = {}
+        for i in indices:
+            slide = slides[i]
+            logger.info("Generating image for slide %d (%s)", i + 1, slide.get("layout", ""))
+            prompts[i] = self._build_prompt(slide, prompt_template, deck_context)
+        
+        images = dict(zip(prompts, self.generate_batch(list(prompts.values()))))
         
         updated_slides = []
         for i, slide in enumerate(slides):
-            slide_type = slide.get("layout", "")
-            
-            # Determine if this slide should have an image
-            should_generate = (
-                slide_type in IMAGE_SLIDE_TYPES or
-                slide.get("generate_image", False) or
-                i == 0  # Always generate for first slide (title)
-            )
-            
-            if should_generate:
-                logger.info("Generating image for slide %d (%s)", i + 1, slide_type)
-                
-                prompt = self._build_prompt(slide, theme_style, deck_context)
-                image_data = self._generate_image(prompt)
-                
+            if i in images:
+                image_data = images[i]
                 if image_data:
                     slide = {**slide, "background_image": image_data}
                     logger.debug("Image generated successfully for slide %d", i + 1)
@@ -112,67 +208,145 @@ class ImageGenerator:
         
         return updated_slides
 
+    def generate_batch(self, prompts: List[str]) -> List[Optional[bytes]]:
+        """Generate images for several prompts as one batch.
+        
+        Identical prompts are requested once. The distinct prompts are sent
+        concurrently, at most max_workers at a time.
+        
+        Args:
+            prompts: Text prompts for image generation
+            
+        Returns:
+            Raw image bytes (or None on failure) for each prompt, in order
+        """
+        unique_prompts = list(dict.fromkeys(prompts))
+        if not unique_prompts:
+            return []
+        
+        workers = min(self.max_workers, len(unique_prompts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = dict(zip(unique_prompts, executor.map(self._generate_image, unique_prompts)))
+        
+        return [results[prompt] for prompt in prompts]
+    
     def _build_prompt(
         self,
         slide: Dict[str, Any],
-        theme_style: Dict[str, str],
+        prompt_template: str,
         deck_context: str,
     ) -> str:
         """Build an image generation prompt from slide content.
         
         Args:
             slide: Slide specification
-            theme_style: Style modifiers from theme
+            prompt_template: Theme prompt from _PROMPT_TEMPLATES
             deck_context: Overall presentation context
             
         Returns:
             Image generation prompt
         """
         content = slide.get("content", {})
-        title = content.get("title", "")
-        subtitle = content.get("subtitle", "")
         slide_type = slide.get("layout", "title")
         
         # Base description from slide content
-        subject = title or subtitle or deck_context or "abstract presentation"
-        
-        # Build the prompt
-        prompt_parts = [
-            f"Create a {theme_style['style']} background image for a presentation slide.",
-            f"Theme: {theme_style['mood']}.",
-            f"Topic: {subject}.",
-            f"Color palette: {theme_style['colors']}.",
-            "The image should be subtle enough to allow white text overlay.",
-            "No text or words in the image.",
-            "Aspect ratio: 16:9, landscape orientation.",
-        ]
-        
-        # Add slide-type specific guidance
-        if slide_type == "title":
-            prompt_parts.append("This is a title slide - make it visually striking but not overwhelming.")
-        elif slide_type == "section":
-            prompt_parts.append("This is a section divider - use abstract shapes or subtle patterns.")
-        
-        prompt = " ".join(prompt_parts)
-        logger.debug("Generated prompt: %s", prompt[:100] + "...")
+        subject = (
+            content.get("title", "") or content.get("subtitle", "")
+            or deck_context or "abstract presentation"
+        )
+        
+        prompt = prompt_template.format(
+            subject=subject, extra=_SLIDE_TYPE_GUIDANCE.get(slide_type, "")
+        )
+        logger.debug("Generated prompt: %.100s...", prompt)
         
         return prompt
 
-    def _generate_image(self, prompt: str) -> Optional[str]:
+    def _generate_image(self, prompt: str) -> Optional[bytes]:
         """Generate an image using Gemini or Imagen API.
         
+        Generated images are kept under the "images" cache directory, keyed
+        by model and prompt, and reused for the same prompt unless use_cache
+        is off. Entries never expire; delete the directory to clear it.
+        
         Args:
             prompt: Text prompt for image generation
             
         Returns:
-            Base64-encoded image data, or None if generation failed
+            Raw image bytes, or None if generation failed
         """
+        cache_key = hashlib.sha256(f"{self.model}|{prompt}".encode("utf-8")).hexdigest()
+        if self.use_cache:
+            cached = self._read_image_cache(cache_key)
+            if cached is not None:
+                logger.debug("Using cached image %.12s", cache_key)
+                return cached
+        
         if self._use_imagen_api:
-            return self._generate_image_imagen(prompt)
+            image_data = self._generate_image_imagen(prompt)
         else:
-            return self._generate_image_gemini(prompt)
+            image_data = self._generate_image_gemini(prompt)
+        
+        if image_data and self.use_cache:
+            self._write_image_cache(cache_key, image_data)
+        return image_data
+    
+    def _read_image_cache(self, cache_key: str) -> Optional[bytes]:
+        """Return a previously generated image for cache_key, if any."""
+        try:
+            return (get_cache_dir("images") / f"{cache_key}.img").read_bytes()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Image cache unavailable: %s", e)
+            return None
     
-    def _generate_image_gemini(self, prompt: str) -> Optional[str]:
+    def _write_image_cache(self, cache_key: str, image_data: bytes) -> None:
+        """Store a generated image; failures only cost a repeat API call."""
+        try:
+            cache_dir = get_cache_dir("images")
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                f.write(image_data)
+            os.replace(f.name, cache_dir / f"{cache_key}.img")
+        except Exception as e:
+            logger.debug("Could not write image cache: %s", e)
+    
+    def _post_json(self, url: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """POST a JSON payload and return the decoded JSON response.
+        
+        Rate-limited requests (HTTP 429) are retried with jittered exponential
+        backoff, honouring Retry-After (up to MAX_RETRY_AFTER) when the server
+        sends it; any other error is raised to the caller.
+        """
+        data = _json_dumps(payload)
+        
+        attempt = 0
+        while True:
+            request = urllib.request.Request(
+                url,
+                data=data,
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=timeout) as response:
+                    return _json_loads(response.read())
+            except urllib.error.HTTPError as e:
+                if e.code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                retry_after = e.headers.get("Retry-After", "") if e.headers else ""
+                if retry_after.isdigit():
+                    delay = min(float(retry_after), MAX_RETRY_AFTER)
+                else:
+                    delay = RATE_LIMIT_BACKOFF * 2 ** attempt * random.uniform(0.5, 1.5)
+                e.close()
+                logger.info("Rate limited, retrying in %.1fs", delay)
+                time.sleep(delay)
+                attempt += 1
+    
+    def _generate_image_gemini(self, prompt: str) -> Optional[bytes]:
         """Generate image using Gemini's native image generation (nano-banana, etc.)."""
         url = f"{self.base_url}/models/{self.model}:generateContent?key={self.api_key}"
         
@@ -189,30 +363,24 @@ class ImageGenerator:
         }
         
         try:
-            request = urllib.request.Request(
-                url,
-                data=json.dumps(payload).encode("utf-8"),
-                headers={"Content-Type": "application/json"},
-                method="POST",
-            )
-            
-            with urllib.request.urlopen(request, timeout=90) as response:
-                result = json.loads(response.read().decode())
+            result = self._post_json(url, payload, timeout=90)
             
-            # Extract base64 image from Gemini response
+            # Extract and decode the base64 image from Gemini response
             candidates = result.get("candidates", [])
             if candidates:
                 parts = candidates[0].get("content", {}).get("parts", [])
                 for part in parts:
                     if "inlineData" in part:
-                        return part["inlineData"].get("data")
+                        data = part["inlineData"].get("data")
+                        return base64.b64decode(data) if data else None
             
             logger.warning("No image data in Gemini response: %s", result.keys())
             return None
             
         except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if hasattr(e, 'read') else ""
-            logger.error("Gemini API error %d: %s", e.code, error_body[:300])
+            # Only the start of the body is logged, so only decode that much
+            error_body = e.read(300).decode("utf-8", "replace") if hasattr(e, 'read') else ""
+            logger.error("Gemini API error %d: %s", e.code, error_body)
             return None
         except urllib.error.URLError as e:
             logger.error("Network error: %s", e.reason)
@@ -221,7 +389,7 @@ class ImageGenerator:
             logger.error("Image generation failed: %s", e)
             return None
     
-    def _generate_image_imagen(self, prompt: str) -> Optional[str]:
+    def _generate_image_imagen(self, prompt: str) -> Optional[bytes]:
         """Generate image using Imagen API (predict endpoint)."""
         url = f"{self.base_url}/models/{self.model}:predict?key={self.api_key}"
         
@@ -236,27 +404,19 @@ class ImageGenerator:
         }
         
         try:
-            request = urllib.request.Request(
-                url,
-                data=json.dumps(payload).encode("utf-8"),
-                headers={"Content-Type": "application/json"},
-                method="POST",
-            )
-            
-            with urllib.request.urlopen(request, timeout=60) as response:
-                result = json.loads(response.read().decode())
+            result = self._post_json(url, payload, timeout=60)
             
-            # Extract base64 image from response
+            # Extract and decode the base64 image from response
             predictions = result.get("predictions", [])
             if predictions and "bytesBase64Encoded" in predictions[0]:
-                return predictions[0]["bytesBase64Encoded"]
+                return base64.b64decode(predictions[0]["bytesBase64Encoded"])
             
             logger.warning("No image data in Imagen response")
             return None
             
         except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if hasattr(e, 'read') else ""
-            logger.error("Imagen API error %d: %s", e.code, error_body[:200])
+            error_body = e.read(200).decode("utf-8", "replace") if hasattr(e, 'read') else ""
+            logger.error("Imagen API error %d: %s", e.code, error_body)
             return None
         except urllib.error.URLError as e:
             logger.error("Network error: %s", e.reason)
@@ -265,14 +425,14 @@ class ImageGenerator:
             logger.error("Image generation failed: %s", e)
             return None
 
-    def generate_single_image(self, prompt: str) -> Optional[str]:
+    def generate_single_image(self, prompt: str) -> Optional[bytes]:
         """Generate a single image from a custom prompt.
         
         Args:
             prompt: Custom prompt for image generation
             
         Returns:
-            Base64-encoded image data, or None if generation failed
+            Raw image bytes, or None if generation failed
         """
         if not self.enabled:
             logger.warning("Image generation disabled - no API key")
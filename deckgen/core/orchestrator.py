@@ -1,16 +1,60 @@
 """Main orchestrator for deck generation pipeline."""
 
 import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
 from .analyzer import ContentAnalyzer
-from .designer import ThemeDesigner
+from .designer import get_theme_designer
 from .image_generator import ImageGenerator
-from .renderer import HTMLRenderer
+from .renderer import get_html_renderer
 
 logger = logging.getLogger(__name__)
 
+# str.translate table for ASCII slugs: space -> "-", drop non-alphanumerics
+_SLUG_TABLE = {
+    c: None
+    for c in range(128)
+    if not (chr(c).isalnum() or chr(c) == "-")
+}
+_SLUG_TABLE[ord(" ")] = ord("-")
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:  # unknown or indeterminate (-1)
+    _IOV_MAX = 16  # POSIX minimum
+
+
+def _write_chunks(path: Path, chunks: List[bytes]) -> None:
+    """Write chunks to path back to back, with a single writev() if possible."""
+    if not hasattr(os, "writev"):
+        with open(path, "wb") as f:
+            f.writelines(chunks)
+        return
+    
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        views = [memoryview(chunk) for chunk in chunks if chunk]
+        start = 0
+        while start < len(views):
+            written = os.writev(fd, views[start:start + _IOV_MAX])
+            if not written:
+                raise OSError(f"writev() wrote nothing to {path}")
+            # Skip what was written; a partial write resumes mid-chunk
+            while written:
+                if written >= len(views[start]):
+                    written -= len(views[start])
+                    start += 1
+                else:
+                    views[start] = views[start][written:]
+                    written = 0
+    finally:
+        os.close(fd)
+
 
 class DeckOrchestrator:
     """Orchestrates the complete deck generation pipeline."""
@@ -23,9 +67,9 @@ class DeckOrchestrator:
                      If not provided, reads from GEMINI_API_KEY env var.
         """
         self.analyzer = ContentAnalyzer()
-        self.designer = ThemeDesigner()
+        self.designer = get_theme_designer()
         self.image_generator = ImageGenerator(api_key=api_key)
-        self.renderer = HTMLRenderer()
+        self.renderer = get_html_renderer()
     
     def create_deck(
         self,
@@ -48,7 +92,7 @@ class DeckOrchestrator:
         Returns:
             Path to generated HTML file
         """
-        logger.info("Starting deck generation for: %s", description[:50])
+        logger.info("Starting deck generation for: %.50s", description)
         
         # Step 1: Analyze content
         logger.debug("Step 1: Analyzing content")
@@ -62,44 +106,57 @@ class DeckOrchestrator:
         slides = self.designer.design_slides(content_brief, theme_name)
         logger.info("Selected theme: %s, Generated %d slides", theme_name, len(slides))
         
-        # Step 3: Generate images (if enabled)
+        # Step 3: Generate images (if enabled) in the background; the
+        # requests are network-bound, so the rest of the setup overlaps them
+        images_future: Optional[Future] = None
         if generate_images and self.image_generator.enabled:
             logger.debug("Step 3: Generating images")
-            slides = self.image_generator.generate_images_for_slides(
+            executor = ThreadPoolExecutor(max_workers=1)
+            images_future = executor.submit(
+                self.image_generator.generate_images_for_slides,
                 slides=slides,
                 theme_name=theme_name,
                 deck_context=description,
             )
+            executor.shutdown(wait=False)
         elif generate_images:
             logger.info("Image generation skipped - no API key configured")
         
-        # Step 4: Render HTML
-        logger.debug("Step 4: Rendering HTML")
+        # Work that does not depend on the images
+        self.renderer.preload_theme(theme_name)
         # Use title from content brief (extracted by analyzer)
-        title = content_brief.get("slides", [{}])[0].get("title", description[:60])
-        html = self.renderer.render(slides, theme_name, title)
-        
-        # Step 4: Save to file
+        brief_slides = content_brief.get("slides")
+        title = brief_slides[0].title if brief_slides else description[:60]
         if not output_path:
             output_path = self._generate_output_path(description)
         
+        if images_future is not None:
+            slides = images_future.result()
+        
+        # Step 4: Render HTML
+        logger.debug("Step 4: Rendering HTML")
+        html_parts = self.renderer.render_parts(slides, theme_name, title)
+        
+        # Step 5: Save to file
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, "w") as f:
-            f.write(html)
+        # Encode piece by piece, in the charset the page declares, rather
+        # than joining and encoding the whole document
+        _write_chunks(output_file, [part.encode("utf-8") for part in html_parts])
         
         logger.info("Deck saved to: %s", output_file)
         return str(output_file.absolute())
     
     def _generate_output_path(self, description: str) -> str:
         """Generate output filename from description."""
-        # Create slug from description
+        # Create slug from description: spaces become dashes and other
+        # non-alphanumerics are dropped, in a single translate() for ASCII
         slug = description.lower()
-        slug = slug.replace(" ", "-")
-        
-        # Remove special characters
-        slug = "".join(c for c in slug if c.isalnum() or c == "-")
+        if slug.isascii():
+            slug = slug.translate(_SLUG_TABLE)
+        else:
+            slug = "".join(c for c in slug.replace(" ", "-") if c.isalnum() or c == "-")
         
         # Limit length
         slug = slug[:50]
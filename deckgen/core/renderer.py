@@ -1,73 +1,30 @@
 """HTML rendering from templates and design specifications."""
 
+import base64
+import functools
+import os
+import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
-class HTMLRenderer:
-    """Renders HTML presentations from design specifications."""
-    
-    def __init__(self):
-        """Initialize renderer with templates."""
-        self.templates_dir = Path(__file__).parent.parent / "templates"
-        self.layouts_dir = self.templates_dir / "layouts"
-    
-    def render(
-        self, 
-        slides: List[Dict[str, Any]], 
-        theme_name: str,
-        title: str = "Presentation"
-    ) -> str:
-        """
-        Render complete HTML presentation.
-        
-        Args:
-            slides: List of slide specifications
-            theme_name: Theme to use
-            title: Presentation title
-            
-        Returns:
-            Complete HTML string
-        """
-        theme = self._load_theme(theme_name)
-        css = self._generate_css(theme)
-        nav_js = self._generate_navigation_js()
-        slides_html = self._render_slides(slides, theme)
-        
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title[:60]}</title>
-    <style>
-        {css}
-    </style>
-</head>
-<body>
-    {slides_html}
-    <div class="nav" id="nav"></div>
-    <div class="slide-counter" id="counter"></div>
-    <script>
-        {nav_js}
-    </script>
-</body>
-</html>"""
-        
-        return html
-    
-    def _load_theme(self, theme_name: str) -> Dict[str, Any]:
-        """Load theme configuration."""
-        theme_file = Path(__file__).parent.parent / "themes" / f"{theme_name}.yaml"
-        
-        with open(theme_file, "r") as f:
-            return yaml.safe_load(f)
-    
-    def _generate_navigation_js(self) -> str:
-        """Generate navigation JavaScript with keyboard, touch, and click support."""
-        return """
+
+@functools.lru_cache(maxsize=64)
+def _read_theme_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a theme file; mtime_ns is part of the key so edits are seen."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+# Slide navigation (keyboard, touch and click); independent of the deck
+_NAV_JS = """
         let currentSlide = 0;
         const slides = document.querySelectorAll('.slide');
         const nav = document.getElementById('nav');
@@ -187,30 +144,126 @@ class HTMLRenderer:
         
         updateCounter();
         """
+
+
+def _minify_js(js: str) -> str:
+    """Strip comments, indentation and blank lines from JS, keeping line breaks.
     
-    def _generate_css(self, theme: Dict[str, Any]) -> str:
-        """Generate CSS from theme configuration with responsive design."""
+    Only // comments that start a line or follow a statement's ; { or } are
+    removed, so // inside string literals survives. Line breaks are kept
+    because automatic semicolon insertion may rely on them.
+    """
+    lines = (re.sub(r"([;{}])\s+//.*$", r"\1", line.strip()) for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+_NAV_JS = _minify_js(_NAV_JS)
+
+# Fixed text around the variable parts of the document, see render_parts()
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>"""
+_HTML_STYLE = """</title>
+    <style>
+        """
+_HTML_BODY = """
+    </style>
+</head>
+<body>
+    """
+_HTML_SCRIPT = """
+    <div class="nav" id="nav"></div>
+    <div class="slide-counter" id="counter"></div>
+    <script>
+        """
+_HTML_END = """
+    </script>
+</body>
+</html>"""
+
+
+@dataclass(frozen=True, slots=True)
+class _ThemeStyle:
+    """Theme colors and typography used by _CSS_TEMPLATE, with fallbacks."""
+    background: str = '#000'
+    text_primary: str = '#fff'
+    text_secondary: str = 'rgba(255,255,255,0.7)'
+    accent: str = '#0A84FF'
+    accent_secondary: str = '#98D4A0'
+    card_bg: str = 'rgba(255,255,255,0.05)'
+    border: str = 'rgba(255,255,255,0.1)'
+    primary_font: str = '-apple-system, BlinkMacSystemFont, sans-serif'
+    code_font: str = "'SF Mono', 'Consolas', monospace"
+    headline_weight: Any = 700
+    
+    @classmethod
+    def from_theme(cls, theme: Dict[str, Any]) -> "_ThemeStyle":
+        """Resolve every style value of a theme config once."""
         colors = theme.get("colors", {})
         typography = theme.get("typography", {})
-        
-        bg = colors.get('background', '#000')
-        text_primary = colors.get('text_primary', '#fff')
-        text_secondary = colors.get('text_secondary', 'rgba(255,255,255,0.7)')
-        accent = colors.get('accent', '#0A84FF')
-        accent_secondary = colors.get('accent_secondary', '#98D4A0')
-        card_bg = colors.get('card_bg', 'rgba(255,255,255,0.05)')
-        border = colors.get('border', 'rgba(255,255,255,0.1)')
-        
-        primary_font = typography.get('primary_font', '-apple-system, BlinkMacSystemFont, sans-serif')
-        code_font = typography.get('code_font', "'SF Mono', 'Consolas', monospace")
-        headline_weight = typography.get('headline_weight', 700)
-        
-        # Determine nav dot inactive color based on background brightness
-        # For dark backgrounds use white-based, for light use black-based
-        nav_dot_inactive = 'rgba(255,255,255,0.3)' if bg.startswith('#0') or bg.startswith('#1') or bg.startswith('#2') else 'rgba(0,0,0,0.3)'
-        counter_color = 'rgba(255,255,255,0.4)' if bg.startswith('#0') or bg.startswith('#1') or bg.startswith('#2') else 'rgba(0,0,0,0.4)'
-        
-        return f"""
+        values = {}
+        for name in cls.__dataclass_fields__:
+            if name in colors:
+                values[name] = colors[name]
+            elif name in typography:
+                values[name] = typography[name]
+        return cls(**values)
+
+
+def _background_url(image: Any) -> str:
+    """CSS url() embedding a background image given as PNG bytes or base64 text."""
+    # Images travel as raw bytes; encode only here, at emission
+    if isinstance(image, bytes):
+        image = base64.b64encode(image).decode("ascii")
+    return f"url(data:image/png;base64,{image})"
+
+
+def _collect_backgrounds(slides: List[Dict[str, Any]]) -> Dict[Any, int]:
+    """Map each distinct background image in slides to an index, in order of use."""
+    bg_vars: Dict[Any, int] = {}
+    for slide_spec in slides:
+        bg_image = slide_spec.get("background_image")
+        if bg_image and bg_image not in bg_vars:
+            bg_vars[bg_image] = len(bg_vars)
+    return bg_vars
+
+
+def _background_css(bg_vars: Dict[Any, int]) -> str:
+    """Declare each background image once, as a --bg-<index> custom property."""
+    decls = ";".join(
+        f"--bg-{index}:{_background_url(image)}" for image, index in bg_vars.items()
+    )
+    return f":root{{{decls}}}"
+
+
+def _is_dark_bg(bg: str) -> bool:
+    """Whether a hex background color (#RGB, #RGBA, #RRGGBB, ...) is dark.
+    
+    Judged on the red channel alone, which is enough for theme backgrounds;
+    anything that is not a hex color is treated as light.
+    """
+    if len(bg) < 4 or bg[0] != '#':
+        return False
+    red = bg[1] * 2 if len(bg) < 7 else bg[1:3]
+    try:
+        return int(red, 16) < 0x40
+    except ValueError:
+        return False
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments, indentation and line breaks from CSS."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    return "".join(line.strip() for line in css.splitlines())
+
+
+# Stylesheet skeleton, filled in by HTMLRenderer._generate_css() from a
+# _ThemeStyle; literal braces are doubled. Kept readable here and
+# minified once at import.
+_CSS_TEMPLATE = """
         :root {{
             /* Fluid typography scale */
             --font-headline: clamp(36px, 8vw, 72px);
@@ -231,13 +284,13 @@ class HTMLRenderer:
             --space-element-margin: clamp(16px, 3vw, 40px);
             
             /* Theme colors as CSS variables */
-            --color-bg: {bg};
-            --color-text: {text_primary};
-            --color-text-secondary: {text_secondary};
-            --color-accent: {accent};
-            --color-accent-secondary: {accent_secondary};
-            --color-card-bg: {card_bg};
-            --color-border: {border};
+            --color-bg: {style.background};
+            --color-text: {style.text_primary};
+            --color-text-secondary: {style.text_secondary};
+            --color-accent: {style.accent};
+            --color-accent-secondary: {style.accent_secondary};
+            --color-card-bg: {style.card_bg};
+            --color-border: {style.border};
         }}
         
         * {{ margin: 0; padding: 0; box-sizing: border-box; }}
@@ -248,7 +301,7 @@ class HTMLRenderer:
         }}
         
         body {{
-            font-family: {primary_font};
+            font-family: {style.primary_font};
             background: var(--color-bg);
             color: var(--color-text);
             overflow: hidden;
@@ -271,7 +324,7 @@ class HTMLRenderer:
         
         .headline {{
             font-size: var(--font-headline);
-            font-weight: {headline_weight};
+            font-weight: {style.headline_weight};
             letter-spacing: -0.02em;
             line-height: 1.1;
             margin-bottom: var(--space-gap-small);
@@ -395,7 +448,7 @@ class HTMLRenderer:
             border: 1px solid var(--color-border);
             border-radius: clamp(8px, 1.5vw, 12px);
             padding: var(--space-gap-medium);
-            font-family: {code_font};
+            font-family: {style.code_font};
             font-size: var(--font-code);
             line-height: 1.6;
             color: var(--color-accent-secondary);
@@ -545,55 +598,217 @@ class HTMLRenderer:
             }}
         }}
         """
+_CSS_TEMPLATE = _minify_css(_CSS_TEMPLATE)
+
+
+class HTMLRenderer:
+    """Renders HTML presentations from design specifications."""
+    
+    __slots__ = ("templates_dir", "layouts_dir", "_css_cache")
+    
+    # Layout -> name of the method rendering it; unknown layouts fall back
+    # to _render_simple_slide
+    _LAYOUT_RENDERERS = {
+        "title_center": "_render_title_slide",
+        "statement": "_render_statement_slide",
+        "bullet_points": "_render_bullet_slide",
+        "numbered_list": "_render_numbered_slide",
+        "grid_thirds": "_render_cards_slide",
+        "table_slide": "_render_table_slide",
+        "code_example": "_render_code_slide",
+        "architecture": "_render_architecture_slide",
+        "stat_grid": "_render_stats_slide",
+        "cta_final": "_render_cta_slide",
+    }
     
-    def _render_slides(self, slides: List[Dict[str, Any]], theme: Dict[str, Any]) -> str:
-        """Render all slides."""
-        html_slides = []
+    def __init__(self):
+        """Initialize renderer with templates.
         
-        for i, slide_spec in enumerate(slides):
-            slide_html = self._render_slide(slide_spec, i == 0)
-            html_slides.append(slide_html)
+        Prefer get_html_renderer(), which shares one instance per process.
+        """
+        self.templates_dir = Path(__file__).parent.parent / "templates"
+        self.layouts_dir = self.templates_dir / "layouts"
+        # theme name -> (theme dict the CSS was built from, CSS)
+        self._css_cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
+    
+    def render(
+        self, 
+        slides: List[Dict[str, Any]], 
+        theme_name: str,
+        title: str = "Presentation"
+    ) -> str:
+        """
+        Render complete HTML presentation.
         
-        return "\n".join(html_slides)
+        Args:
+            slides: List of slide specifications
+            theme_name: Theme to use
+            title: Presentation title
+            
+        Returns:
+            Complete HTML string
+        """
+        return "".join(self.render_parts(slides, theme_name, title))
+    
+    def render_parts(
+        self, 
+        slides: List[Dict[str, Any]], 
+        theme_name: str,
+        title: str = "Presentation"
+    ) -> List[str]:
+        """
+        Render the presentation as consecutive pieces of the HTML document.
+        
+        Joining the pieces gives render()'s output; writing them out one by
+        one avoids building the whole document, which can be large when
+        images are embedded, as a single string.
+        
+        Args:
+            slides: List of slide specifications
+            theme_name: Theme to use
+            title: Presentation title
+            
+        Returns:
+            Pieces of the complete HTML document, in order
+        """
+        return list(self._iter_parts(slides, theme_name, title))
     
-    def _render_slide(self, slide_spec: Dict[str, Any], is_first: bool = False) -> str:
-        """Render a single slide based on its layout."""
+    def render_to(
+        self, 
+        slides: List[Dict[str, Any]], 
+        theme_name: str,
+        out: TextIO,
+        title: str = "Presentation"
+    ) -> None:
+        """
+        Render the presentation straight into a text stream.
+        
+        Each slide is written as soon as it is rendered, so at most one
+        slide's HTML is held in memory at a time.
+        
+        Args:
+            slides: List of slide specifications
+            theme_name: Theme to use
+            out: Writable text stream, e.g. a file opened with encoding="utf-8"
+            title: Presentation title
+        """
+        write = out.write
+        for part in self._iter_parts(slides, theme_name, title):
+            write(part)
+    
+    def _iter_parts(
+        self, 
+        slides: List[Dict[str, Any]], 
+        theme_name: str,
+        title: str
+    ) -> Iterator[str]:
+        """Yield the pieces of the HTML document in order, one per slide in the body."""
+        theme = self._load_theme(theme_name)
+        bg_vars = _collect_backgrounds(slides)
+        yield _HTML_HEAD
+        yield title[:60]
+        yield _HTML_STYLE
+        yield self._theme_css(theme_name, theme)
+        if bg_vars:
+            yield _background_css(bg_vars)
+        yield _HTML_BODY
+        yield from self._iter_slides(slides, bg_vars)
+        yield _HTML_SCRIPT
+        yield self._generate_navigation_js()
+        yield _HTML_END
+    
+    def preload_theme(self, theme_name: str) -> None:
+        """Load and cache a theme and its CSS ahead of render(), e.g. while images generate."""
+        self._theme_css(theme_name, self._load_theme(theme_name))
+    
+    def _load_theme(self, theme_name: str) -> Dict[str, Any]:
+        """Load theme configuration.
+        
+        Parsed themes are memoized per file and modification time, so
+        repeated renders only stat the theme file. The returned dict is
+        shared between renders and must not be modified.
+        """
+        theme_file = str(Path(__file__).parent.parent / "themes" / f"{theme_name}.yaml")
+        return _read_theme_file(theme_file, os.stat(theme_file).st_mtime_ns)
+    
+    def _generate_navigation_js(self) -> str:
+        """Generate navigation JavaScript with keyboard, touch, and click support."""
+        return _NAV_JS
+    
+    def _theme_css(self, theme_name: str, theme: Dict[str, Any]) -> str:
+        """Return the theme's CSS, generating it only when the theme changed.
+        
+        _load_theme() returns the same dict until the theme file changes, so
+        dict identity tells whether the cached CSS is still current.
+        """
+        cached = self._css_cache.get(theme_name)
+        if cached is not None and cached[0] is theme:
+            return cached[1]
+        
+        css = self._generate_css(theme)
+        self._css_cache[theme_name] = (theme, css)
+        return css
+    
+    def _generate_css(self, theme: Dict[str, Any]) -> str:
+        """Generate CSS from theme configuration with responsive design."""
+        style = _ThemeStyle.from_theme(theme)
+        
+        # Determine nav dot inactive color based on background brightness
+        # For dark backgrounds use white-based, for light use black-based
+        is_dark = _is_dark_bg(style.background)
+        
+        return _CSS_TEMPLATE.format(
+            style=style,
+            nav_dot_inactive='rgba(255,255,255,0.3)' if is_dark else 'rgba(0,0,0,0.3)',
+            counter_color='rgba(255,255,255,0.4)' if is_dark else 'rgba(0,0,0,0.4)',
+        )
+    
+    def _iter_slides(
+        self, 
+        slides: List[Dict[str, Any]], 
+        bg_vars: Optional[Dict[Any, int]] = None
+    ) -> Iterator[str]:
+        """Yield each slide's HTML, with the newlines that separate them."""
+        render_slide = self._render_slide
+        for i, slide_spec in enumerate(slides):
+            if i:
+                yield "\n"
+            yield render_slide(slide_spec, i == 0, bg_vars)
+    
+    def _render_slide(
+        self, 
+        slide_spec: Dict[str, Any], 
+        is_first: bool = False,
+        bg_vars: Optional[Dict[Any, int]] = None
+    ) -> str:
+        """Render a single slide based on its layout.
+        
+        Args:
+            slide_spec: Slide specification
+            is_first: Whether this is the initially active slide
+            bg_vars: Background images already declared as CSS variables,
+                mapped to their index; other images are inlined
+        """
         layout = slide_spec.get("layout", "title_center")
         content = slide_spec.get("content", {})
         active = " active" if is_first else ""
         bg_image = slide_spec.get("background_image")
         
-        # Build inline style for background image if present
+        # Inline style attribute, with its leading space, for a background image
         bg_style = ""
         if bg_image:
+            if bg_vars and bg_image in bg_vars:
+                bg_url = f"var(--bg-{bg_vars[bg_image]})"
+            else:
+                bg_url = _background_url(bg_image)
             bg_style = (
-                f'style="background-image: linear-gradient(rgba(0,0,0,0.5), rgba(0,0,0,0.7)), '
-                f'url(data:image/png;base64,{bg_image}); '
+                f' style="background-image: linear-gradient(rgba(0,0,0,0.5), rgba(0,0,0,0.7)), '
+                f'{bg_url}; '
                 f'background-size: cover; background-position: center;"'
             )
         
-        if layout == "title_center":
-            return self._render_title_slide(content, active, bg_style)
-        elif layout == "statement":
-            return self._render_statement_slide(content, active, bg_style)
-        elif layout == "bullet_points":
-            return self._render_bullet_slide(content, active, bg_style)
-        elif layout == "numbered_list":
-            return self._render_numbered_slide(content, active, bg_style)
-        elif layout == "grid_thirds":
-            return self._render_cards_slide(content, active, bg_style)
-        elif layout == "table_slide":
-            return self._render_table_slide(content, active, bg_style)
-        elif layout == "code_example":
-            return self._render_code_slide(content, active, bg_style)
-        elif layout == "architecture":
-            return self._render_architecture_slide(content, active, bg_style)
-        elif layout == "stat_grid":
-            return self._render_stats_slide(content, active, bg_style)
-        elif layout == "cta_final":
-            return self._render_cta_slide(content, active, bg_style)
-        else:
-            return self._render_simple_slide(content, active, bg_style)
+        renderer = getattr(self, self._LAYOUT_RENDERERS.get(layout, "_render_simple_slide"))
+        return renderer(content, active, bg_style)
     
     def _render_title_slide(self, content: Dict[str, Any], active: str, bg_style: str = "") -> str:
         title = self._escape_html(content.get("title", "Presentation"))
@@ -601,7 +816,7 @@ class HTMLRenderer:
         subtitle_html = f'<p class="subhead">{subtitle}</p>' if subtitle else ""
         
         return f"""
-<div class="slide{active} center" {bg_style}>
+<div class="slide{active} center"{bg_style}>
     <h1 class="headline">{title}</h1>
     {subtitle_html}
 </div>"""
@@ -611,7 +826,7 @@ class HTMLRenderer:
         statement = self._escape_html(content.get("statement", ""))
         
         return f"""
-<div class="slide{active}" {bg_style}>
+<div class="slide{active}"{bg_style}>
     <h2 class="headline">{title}</h2>
     <p class="statement">{statement}</p>
 </div>"""
@@ -620,13 +835,11 @@ class HTMLRenderer:
         title = self._escape_html(content.get("title", "Key Points"))
         points = content.get("points", [])
         
-        points_html = "\n".join([
-            f'        <li>{self._escape_html(p)}</li>' 
-            for p in points
-        ])
+        escape = self._escape_html
+        points_html = "\n".join([f'        <li>{escape(p)}</li>' for p in points])
         
         return f"""
-<div class="slide{active}" {bg_style}>
+<div class="slide{active}"{bg_style}>
     <h2 class="headline">{title}</h2>
     <ul class="bullet-list">
 {points_html}
@@ -637,13 +850,11 @@ class HTMLRenderer:
         title = self._escape_html(content.get("title", "Steps"))
         items = content.get("items", [])
         
-        items_html = "\n".join([
-            f'        <li>{self._escape_html(item)}</li>' 
-            for item in items
-        ])
+        escape = self._escape_html
+        items_html = "\n".join([f'        <li>{escape(item)}</li>' for item in items])
         
         return f"""
-<div class="slide{active}" {bg_style}>
+<div class="slide{active}"{bg_style}>
     <h2 class="headline">{title}</h2>
     <ol class="numbered-list">
 {items_html}
@@ -656,16 +867,17 @@ class HTMLRenderer:
         
         grid_class = "thirds" if len(cards) >= 3 else "halves"
         
+        escape = self._escape_html
         cards_html = "\n".join([
             f'''        <div class="card">
-            <div class="card-title">{self._escape_html(c.get("title", ""))}</div>
-            <div class="card-text">{self._escape_html(c.get("description", ""))}</div>
+            <div class="card-title">{escape(c.get("title", ""))}</div>
+            <div class="card-text">{escape(c.get("description", ""))}</div>
         </div>'''
             for c in cards[:3]
         ])
         
         return f"""
-<div class="slide{active}" {bg_style}>
+<div class="slide{active}"{bg_style}>
     <h2 class="headline">{title}</h2>
     <div class="{grid_class}">
 {cards_html}
@@ -679,18 +891,22 @@ class HTMLRenderer:
         if not table_data:
             return self._render_simple_slide({"title": title}, active, bg_style)
         
+        escape = self._escape_html
+        
         # Get headers from first row keys
-        headers = list(table_data[0].keys())
+        headers = tuple(table_data[0])
         
-        header_html = "".join([f"<th>{self._escape_html(h)}</th>" for h in headers])
+        header_html = "".join([f"<th>{escape(h)}</th>" for h in headers])
         
-        rows_html = ""
-        for row in table_data[:6]:  # Max 6 rows
-            cells = "".join([f"<td>{self._escape_html(str(row.get(h, '')))}</td>" for h in headers])
-            rows_html += f"        <tr>{cells}</tr>\n"
+        rows_html = "".join([
+            "        <tr>"
+            + "".join([f"<td>{escape(row.get(h, ''))}</td>" for h in headers])
+            + "</tr>\n"
+            for row in table_data[:6]  # Max 6 rows
+        ])
         
         return f"""
-<div class="slide{active}" {bg_style}>
+<div class="slide{active}"{bg_style}>
     <h2 class="headline">{title}</h2>
     <table class="data-table">
         <thead><tr>{header_html}</tr></thead>
@@ -704,7 +920,7 @@ class HTMLRenderer:
         code = self._escape_html(content.get("code", "# Example"))
         
         return f"""
-<div class="slide{active}" {bg_style}>
+<div class="slide{active}"{bg_style}>
     <h2 class="headline">{title}</h2>
     <pre class="code-block">{code}</pre>
 </div>"""
@@ -716,7 +932,8 @@ class HTMLRenderer:
         
         points_html = ""
         if points:
-            points_list = "\n".join([f'        <li>{self._escape_html(p)}</li>' for p in points[:4]])
+            escape = self._escape_html
+            points_list = "\n".join([f'        <li>{escape(p)}</li>' for p in points[:4]])
             points_html = f"""
     <ul class="bullet-list">
 {points_list}
@@ -725,7 +942,7 @@ class HTMLRenderer:
         desc_html = f'<p class="statement">{description}</p>' if description else ""
         
         return f"""
-<div class="slide{active}" {bg_style}>
+<div class="slide{active}"{bg_style}>
     <h2 class="headline">{title}</h2>
     {desc_html}
     {points_html}
@@ -735,16 +952,17 @@ class HTMLRenderer:
         title = self._escape_html(content.get("title", "Impact"))
         stats = content.get("stats", [])
         
+        escape = self._escape_html
         stats_html = "\n".join([
             f'''        <div>
-            <div class="stat-number">{self._escape_html(s.get("number", ""))}</div>
-            <div class="stat-label">{self._escape_html(s.get("label", ""))}</div>
+            <div class="stat-number">{escape(s.get("number", ""))}</div>
+            <div class="stat-label">{escape(s.get("label", ""))}</div>
         </div>'''
             for s in stats[:3]
         ])
         
         return f"""
-<div class="slide{active}" {bg_style}>
+<div class="slide{active}"{bg_style}>
     <h2 class="headline">{title}</h2>
     <div class="stat-grid">
 {stats_html}
@@ -758,7 +976,7 @@ class HTMLRenderer:
         subtitle_html = f'<p class="subhead">{subtitle}</p>' if subtitle else ""
         
         return f"""
-<div class="slide{active} center" {bg_style}>
+<div class="slide{active} center"{bg_style}>
     <h1 class="headline">{title}</h1>
     {subtitle_html}
 </div>"""
@@ -767,17 +985,31 @@ class HTMLRenderer:
         title = self._escape_html(content.get("title", "Slide"))
         
         return f"""
-<div class="slide{active} center" {bg_style}>
+<div class="slide{active} center"{bg_style}>
     <h1 class="headline">{title}</h1>
 </div>"""
     
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters."""
-        if not isinstance(text, str):
+        # Exact type test: content values are almost always plain str
+        if type(text) is not str:
             text = str(text)
+        # Most slide text has nothing to escape; the membership tests are
+        # memchr scans, cheaper than running the replace chain
+        if not ("&" in text or "<" in text or ">" in text or '"' in text or "'" in text):
+            return text
+        # Chained str.replace measured faster here than str.translate (which
+        # takes a per-character slow path for multi-character replacements)
+        # and html.escape (which also emits &#x27; rather than &#39;)
         return (text
             .replace("&", "&amp;")
             .replace("<", "&lt;")
             .replace(">", "&gt;")
             .replace('"', "&quot;")
             .replace("'", "&#39;"))
+
+
+@functools.lru_cache(maxsize=1)
+def get_html_renderer() -> HTMLRenderer:
+    """Return the process-wide HTMLRenderer, so its caches outlive a single deck."""
+    return HTMLRenderer()
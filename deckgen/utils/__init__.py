@@ -0,0 +1,5 @@
+"""Shared helpers."""
+
+from .cache import get_cache_dir
+
+__all__ = ["get_cache_dir"]
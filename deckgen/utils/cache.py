@@ -0,0 +1,21 @@
+"""Location of deckgen's on-disk caches."""
+
+import os
+from pathlib import Path
+
+
+def get_cache_dir(*parts: str) -> Path:
+    """Return a deckgen cache directory, creating it if needed.
+    
+    Uses ``$XDG_CACHE_HOME/deckgen`` when set, otherwise ``~/.cache/deckgen``.
+    
+    Args:
+        *parts: Optional subdirectory components below the cache root
+        
+    Returns:
+        Path to the cache directory
+    """
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    cache_dir = Path(root, "deckgen", *parts)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir